@@ -16,6 +16,7 @@
 # - ページ選択機能
 # - セッション状態の管理
 # - 条件付き機能の表示制御
+# - カスタムCSSの注入
 # 
 # 依存関係:
 # - streamlit: UIフレームワーク
@@ -30,6 +31,131 @@
 
 import streamlit as st
 
+from logic import clear_api_cache, JANOME_AVAILABLE, WORDCLOUD_AVAILABLE
+
+# =============================================================================
+# ページオプションの定義
+# =============================================================================
+
+# 基本ページオプション
+_BASE_PAGES = (
+    "🔍 検索",           # 基本検索機能
+    "📊 分析",           # 統計分析機能
+    "📚 検索履歴",       # 履歴管理機能
+    "ℹ️ 使い方"          # ヘルプ・ドキュメント
+)
+
+# Janome利用時のページオプション（キーワード分析を分析機能の後に配置）
+_PAGES_WITH_JANOME = (
+    "🔍 検索",
+    "📊 分析",
+    "🏛️ 会議別キーワード分析",  # キーワード分析（Janome必要）
+    "📚 検索履歴",
+    "ℹ️ 使い方"
+)
+
+# ページ名 → 選択肢の位置（再実行ごとのリスト線形探索を避ける）
+_BASE_PAGE_INDEX = {page: i for i, page in enumerate(_BASE_PAGES)}
+_PAGES_WITH_JANOME_INDEX = {page: i for i, page in enumerate(_PAGES_WITH_JANOME)}
+
+# =============================================================================
+# カスタムCSSスタイル定義
+# =============================================================================
+# 
+# 説明:
+# アプリケーションの見た目を改善するためのカスタムCSSを定義します。
+# 各クラスは特定のUI要素のスタイリングに使用されます。
+# モジュール定数にしておき、再実行のたびに文字列を組み立て直さない。
+
+_CUSTOM_CSS = """
+<style>
+    /* メインヘッダーのスタイル */
+    .main-header {
+        font-size: 3rem;
+        color: #1f4e79;
+        text-align: center;
+        margin-bottom: 2rem;
+        text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
+        font-weight: bold;
+    }
+    
+    /* サブヘッダーのスタイル */
+    .sub-header {
+        font-size: 1.5rem;
+        color: #2e6da4;
+        margin-bottom: 1rem;
+        font-weight: 600;
+    }
+    
+    /* ハイライトボックスのスタイル */
+    .highlight-box {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 20px;
+        border-radius: 10px;
+        color: white;
+        margin: 20px 0;
+        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+    }
+    
+    /* メトリックカードのスタイル */
+    .metric-card {
+        background: white;
+        padding: 20px;
+        border-radius: 10px;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        border-left: 4px solid #1f4e79;
+        margin: 10px 0;
+    }
+    
+    /* メトリックカードを横並びにするグリッド */
+    .metric-grid {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
+    }
+    
+    /* 発言カードのスタイル */
+    .speech-card {
+        background: #f8f9fa;
+        border: 1px solid #dee2e6;
+        border-radius: 8px;
+        padding: 15px;
+        margin: 10px 0;
+        border-left: 4px solid #17a2b8;
+        transition: all 0.3s ease;
+    }
+    
+    .speech-card:hover {
+        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+        transform: translateY(-2px);
+    }
+    
+    /* 発言内容のスクロール表示領域 */
+    .speech-box {
+        height: 300px;
+        overflow-y: auto;
+    }
+    
+    /* キーワードハイライトのスタイル */
+    .hl {
+        background-color: #fff3cd;
+        padding: 2px 4px;
+        border-radius: 3px;
+        font-weight: bold;
+    }
+</style>
+"""
+
+def inject_custom_css():
+    """
+    カスタムCSSをページに注入する
+    
+    注意事項:
+    - Streamlitは再実行ごとに表示要素を作り直すため、毎回呼び出す必要がある
+      （キャッシュして呼び出しを省くとスタイルが消える）
+    """
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+
 def show_sidebar():
     """
     サイドバーの表示とページ選択機能
@@ -62,29 +188,19 @@ def show_sidebar():
         st.markdown("### 🔍 検索メニュー")
         st.markdown("---")
         
-        # =====================================================================
-        # ページオプションの定義
-        # =====================================================================
-        
-        # 基本ページオプション
-        page_options = [
-            "🔍 検索",           # 基本検索機能
-            "📊 分析",           # 統計分析機能
-            "📚 検索履歴",       # 履歴管理機能
-            "ℹ️ 使い方"          # ヘルプ・ドキュメント
-        ]
-        
         # =====================================================================
         # 条件付き機能の追加
         # =====================================================================
         
-        # Janomeライブラリが利用可能な場合のみキーワード分析を追加
-        try:
-            from janome.tokenizer import Tokenizer
-            # キーワード分析を適切な位置に挿入（分析機能の後に配置）
-            page_options.insert(2, "🏛️ 会議別キーワード分析")
+        # Janomeライブラリが利用可能な場合のみキーワード分析を含むページ構成を使用
+        # （利用可能性は起動時に一度だけ判定済み）
+        if JANOME_AVAILABLE:
+            page_options = _PAGES_WITH_JANOME
+            page_index = _PAGES_WITH_JANOME_INDEX
             st.success("✅ キーワード分析機能が利用可能です")
-        except ImportError:
+        else:
+            page_options = _BASE_PAGES
+            page_index = _BASE_PAGE_INDEX
             st.warning("⚠️ キーワード分析機能は利用できません（Janome未インストール）")
         
         # =====================================================================
@@ -99,10 +215,8 @@ def show_sidebar():
         # ページ選択UIの表示
         # =====================================================================
         
-        # ページ選択のデフォルト値を設定
-        default_index = 0  # デフォルトは検索ページ
-        if current_page in page_options:
-            default_index = page_options.index(current_page)
+        # ページ選択のデフォルト値を設定（未知のページは検索ページ）
+        default_index = page_index.get(current_page, 0)
         
         # セレクトボックスでページ選択
         page = st.selectbox(
@@ -128,27 +242,30 @@ def show_sidebar():
         st.markdown("---")
         st.markdown("### 📊 アプリケーション情報")
         
-        # 利用可能な機能の表示（独自にチェック）
+        # 利用可能な機能の表示
         available_features = []
         
-        # Janome（形態素解析）の利用可能性チェック
-        try:
-            from janome.tokenizer import Tokenizer
+        # Janome（形態素解析）の利用可能性
+        if JANOME_AVAILABLE:
             available_features.append("✅ 形態素解析")
-        except ImportError:
+        else:
             available_features.append("❌ 形態素解析")
             
-        # WordCloud（ワードクラウド）の利用可能性チェック
-        try:
-            from wordcloud import WordCloud
+        # WordCloud（ワードクラウド）の利用可能性
+        if WORDCLOUD_AVAILABLE:
             available_features.append("✅ ワードクラウド")
-        except ImportError:
+        else:
             available_features.append("❌ ワードクラウド")
         
         # 機能一覧を表示
         for feature in available_features:
             st.markdown(f"- {feature}")
         
+        # APIレスポンスキャッシュのクリア
+        if st.button("🧹 キャッシュをクリア", help="検索結果のキャッシュを削除し、次回検索時にAPIから再取得します"):
+            clear_api_cache()
+            st.success("✅ キャッシュをクリアしました")
+        
         # =====================================================================
         # ヘルプ情報の表示
         # =====================================================================
@@ -30,6 +30,7 @@
 # - janome: 日本語形態素解析（オプション）
 # - wordcloud: ワードクラウド生成（オプション）
 # - matplotlib: グラフ描画（オプション）
+# - orjson: 高速JSON解析（オプション）
 # 
 # API仕様:
 # - エンドポイント: https://kokkai.ndl.go.jp/api/speech
@@ -45,15 +46,29 @@
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import re
 from datetime import date, datetime
 import json
 import pandas as pd
-from collections import Counter
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
+from collections import Counter, OrderedDict
+from itertools import islice
 import os
+import sqlite3
+import csv
+import hashlib
+import html
+import io
+import zlib
+import threading
+import functools
+import importlib.util
+import multiprocessing
+from types import SimpleNamespace
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # =============================================================================
 # 条件付きインポート設定
@@ -63,21 +78,39 @@ import os
 # 一部のライブラリはオプション機能として実装されており、
 # インストールされていない場合でもアプリケーションは動作します。
 # 各ライブラリの利用可能性をチェックし、適切な初期化を行います。
+# 
+# 読み込みに時間のかかるライブラリ（plotly, janome, wordcloud, matplotlib）は
+# 起動を速くするため、実際に使用する関数の中で初めて読み込みます。
 
-# Janome（日本語形態素解析）の条件付きインポート
-try:
-    from janome.tokenizer import Tokenizer
-except ImportError:
-    pass
+# Janome（日本語形態素解析）の利用可能性（モジュールは読み込まずに判定）
+JANOME_AVAILABLE = importlib.util.find_spec('janome') is not None
 
-# WordCloud（ワードクラウド生成）の条件付きインポート
+# WordCloud（ワードクラウド生成）の利用可能性（モジュールは読み込まずに判定）
+WORDCLOUD_AVAILABLE = importlib.util.find_spec('wordcloud') is not None
+
+# orjson（高速JSONパーサー）の条件付きインポート
+# 利用できない場合は標準ライブラリのjsonで代替（どちらもbytesを直接解析可能）
 try:
-    from wordcloud import WordCloud
-    import matplotlib.pyplot as plt
-    import matplotlib.font_manager as fm
-    import numpy as np
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    pass
+    _json_loads = json.loads
+
+# WordCloud（ワードクラウド生成）の遅延インポート
+@functools.lru_cache(maxsize=1)
+def _lazy_wordcloud():
+    """
+    WordCloud関連ライブラリを初回利用時に読み込む
+
+    戻り値:
+    - SimpleNamespace | None: WordCloud, fm を持つ名前空間。利用できない場合はNone
+    """
+    try:
+        from wordcloud import WordCloud
+        import matplotlib.font_manager as fm
+    except ImportError:
+        return None
+    return SimpleNamespace(WordCloud=WordCloud, fm=fm)
 
 # =============================================================================
 # 定数定義
@@ -86,6 +119,1013 @@ except ImportError:
 # APIエンドポイント
 API_URL = "https://kokkai.ndl.go.jp/api/speech"
 
+# ストップワード（除外する単語）の定義
+# 日本語の議事録に特化したストップワードセット
+STOP_WORDS = frozenset({
+    # 基本動詞・助動詞
+    'する', 'ある', 'いる', 'なる', 'れる', 'られる', 'せる', 'させる',
+    
+    # 指示詞・接続詞
+    'この', 'その', 'あの', 'どの', 'という', 'といった', 'として', 'について',
+    'において', 'に対して', 'というふうに', 'だと', 'である', 'です', 'ます',
+    
+    # 助詞・副詞
+    'でき', 'よう', 'もの', 'こと', '場合', '中', 'ため', 'から', 'まで',
+    
+    # 人称代名詞
+    '私', '我々', '皆さん', '皆様', 'あなた', 'あなた方',
+    
+    # 時間表現
+    '今', '現在', '今回', '今度', '先ほど', '先程', '本日', '今日', '昨日', '明日',
+    '時間', '分', '秒', '年', '月', '日', '週', '回', '度', '番', '号',
+    
+    # 応答表現
+    'はい', 'いえ', 'ええ', 'うん', 'そう', 'いや', 'まあ', 'ちょっと', 'やはり', 'やっぱり',
+    
+    # 役職・敬称
+    '委員', '大臣', '議員', '先生', '総理', '副', '会長', '理事', '長', '部長', '課長',
+    '様', 'さん', '氏', '君',
+    
+    # 法律・制度関連
+    '第', '章', '条', '項', '法', '法律', '制度', '政策',
+    
+    # 思考・感情表現
+    '思う', '考える', '感じる', '見る', '聞く', '言う', '話す', '述べる', '申し上げる',
+    '知る', '分かる', '理解する', '説明する', '報告する',
+    
+    # その他
+    'など', 'とか', 'やら', 'かも', 'かもしれない', 'でしょう', 'かもしれません'
+})
+
+# 1回のAPI呼び出しで取得する件数
+API_PAGE_SIZE = 30
+
+# 発言検索APIが1回の呼び出しで返せる件数の上限
+API_MAX_PAGE_SIZE = 100
+
+# 1回の検索で取得する件数の既定値と上限（APIサーバーに負荷をかけないよう上限を設ける）
+# 既定値はAPI呼び出し1回分とし、それ以上はユーザーが指定した場合のみ取得する
+DEFAULT_FETCH_RECORDS = API_PAGE_SIZE
+MAX_FETCH_RECORDS = 200
+
+# 会議別キーワード分析で表示するキーワード数
+TOP_KEYWORDS = 50
+
+# 追加ページ取得時の同時接続数（APIサーバーに負荷をかけないよう小さく抑える）
+FETCH_CONCURRENCY = 2
+
+# キーワードをハイライトする最大文字数（これより後ろはそのまま表示）
+MAX_HIGHLIGHT_CHARS = 20000
+
+# APIレスポンスのキャッシュ有効期間（秒）
+API_CACHE_TTL = 3600
+
+# APIレスポンスの永続キャッシュ（SQLite）ファイル
+API_CACHE_DB = 'api_cache.sqlite3'
+
+# =============================================================================
+# APIレスポンスの永続キャッシュ（SQLite）
+# =============================================================================
+# 
+# 説明:
+# Streamlitの再起動後やセッション間でもAPIレスポンスを再利用するため、
+# 圧縮したレスポンス本文をSQLiteに保存します。
+# 接続はプロセス内で共有し、スレッド間の競合はロックで防ぎます。
+# 作業ディレクトリに書き込めない環境では永続キャッシュを使わずに動作します。
+
+_cache_lock = threading.Lock()
+
+def _open_cache_db():
+    """
+    永続キャッシュのデータベースを開く
+
+    戻り値:
+    - sqlite3.Connection | None: 開けない場合（読み取り専用の環境など）はNone
+    """
+    try:
+        conn = sqlite3.connect(API_CACHE_DB, check_same_thread=False)
+        # WALモードで書き込み時のfsyncを減らし、読み込みと書き込みの競合を避ける
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, ts INTEGER, params TEXT, payload BLOB)"
+        )
+        # 起動時に期限切れのエントリを削除し、ファイルの肥大化を防ぐ
+        # （子プロセスでモジュールが読み込まれた場合は親プロセスに任せる）
+        if multiprocessing.parent_process() is None:
+            conn.execute("DELETE FROM cache WHERE ts < ?", (int(time.time()) - API_CACHE_TTL,))
+        conn.commit()
+        return conn
+    except sqlite3.Error:
+        return None
+
+_cache_conn = _open_cache_db()
+
+def _cache_key(api_params):
+    """APIパラメータから永続キャッシュのキーを生成"""
+    raw = json.dumps(api_params, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.blake2b(raw).hexdigest()
+
+def _persistent_cache_get(key):
+    """
+    永続キャッシュからレスポンス本文を取得
+
+    戻り値:
+    - bytes | None: 有効期間内のレスポンス本文。存在しない・期限切れの場合はNone
+    """
+    if _cache_conn is None:
+        return None
+    try:
+        with _cache_lock:
+            row = _cache_conn.execute(
+                "SELECT payload, ts FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row and time.time() - row[1] < API_CACHE_TTL:
+        return zlib.decompress(row[0])
+    return None
+
+def _persistent_cache_set(key, api_params, content):
+    """レスポンス本文を圧縮して永続キャッシュに保存（保存できない場合は何もしない）"""
+    if _cache_conn is None:
+        return
+    try:
+        with _cache_lock:
+            _cache_conn.execute(
+                "INSERT OR REPLACE INTO cache (key, ts, params, payload) VALUES (?, ?, ?, ?)",
+                (key, int(time.time()), json.dumps(api_params, ensure_ascii=False), zlib.compress(content))
+            )
+            _cache_conn.commit()
+    except sqlite3.Error:
+        pass
+
+def _persistent_cache_clear():
+    """永続キャッシュを全件削除"""
+    if _cache_conn is None:
+        return
+    try:
+        with _cache_lock:
+            _cache_conn.execute("DELETE FROM cache")
+            _cache_conn.commit()
+    except sqlite3.Error:
+        pass
+
+# =============================================================================
+# API通信（キャッシュ付き）
+# =============================================================================
+
+@st.cache_resource(show_spinner=False)
+def _get_session():
+    """
+    HTTPセッションを生成し、再実行間・セッション間で共有する
+
+    機能:
+    - コネクションプールによるKeep-Alive（TCP/TLSハンドシェイクを省略）
+    - 一時的なサーバーエラー（502/503/504）の自動リトライ
+    - gzip圧縮レスポンスの要求
+    """
+    session = requests.Session()
+    session.headers.update({
+        'Connection': 'keep-alive',
+        'Accept-Encoding': 'gzip, deflate',
+        'Accept': 'application/json'
+    })
+    session.mount('https://', HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    ))
+    return session
+
+def _request_page(session, api_params):
+    """
+    国会議事録APIから1ページ分を取得（永続キャッシュを優先）
+
+    注意事項:
+    - 並列取得のワーカースレッドからも呼ばれるため、セッションは引数で受け取る
+
+    戻り値:
+    - dict | None: APIレスポンス（JSON）。本文が空の場合はNone
+    """
+    key = _cache_key(api_params)
+
+    content = _persistent_cache_get(key)
+    if content is not None:
+        return _json_loads(content) if content else None
+
+    # stream=True + withブロックで、エラー時も含め接続を確実にプールへ返却する
+    with session.get(API_URL, params=api_params, timeout=15.0, stream=True) as response:
+        response.raise_for_status()
+        content = response.content
+    if not content:
+        return None
+
+    # 解析に成功した応答だけを保存する（途中で切れた本文やエラーページを
+    # キャッシュの有効期間中ずっと返し続けないように）
+    data = _json_loads(content)
+    _persistent_cache_set(key, api_params, content)
+    return data
+
+class _EmptyResponse(Exception):
+    """APIの応答本文が空だったことを示す（キャッシュさせないために例外で返す）"""
+
+@st.cache_data(ttl=API_CACHE_TTL, max_entries=256, show_spinner=False)
+def _fetch_speeches(params_tuple, max_records=DEFAULT_FETCH_RECORDS):
+    """
+    国会議事録APIを呼び出し、レスポンスをメモ化する
+
+    パラメータ:
+    - params_tuple (tuple): ソート済みの (キー, 値) タプル（ハッシュ可能なキャッシュキー）
+    - max_records (int): 取得する最大件数
+
+    戻り値:
+    - dict: APIレスポンス（JSON）
+
+    注意事項:
+    - 通信エラーや空の応答は例外として送出する（例外はキャッシュされない）
+    - プロセス内キャッシュに無い場合は永続キャッシュを参照する
+    - 該当件数が1ページを超える場合は、max_records件まで
+      残りのページを並列に取得して結合する（ページ単位で永続キャッシュ）
+    """
+    api_params = dict(params_tuple)
+    session = _get_session()
+    data = _request_page(session, api_params)
+    if data is None:
+        raise _EmptyResponse()
+    if not data.get('speechRecord'):
+        return data
+
+    page_size = int(api_params.get('maximumRecords', API_PAGE_SIZE))
+    total = min(int(data.get('numberOfRecords', 0)), max_records)
+    start_records = range(1 + page_size, total + 1, page_size)
+    if not start_records:
+        if len(data['speechRecord']) <= max_records:
+            return data
+        records = data['speechRecord'][:max_records]
+        return {**data, 'speechRecord': records, 'numberOfReturn': len(records)}
+
+    with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as executor:
+        pages = list(executor.map(
+            lambda start: _request_page(session, {**api_params, 'startRecord': start}),
+            start_records
+        ))
+
+    records = list(data['speechRecord'])
+    for page in pages:
+        if page:
+            records.extend(page.get('speechRecord', []))
+    records = records[:max_records]
+
+    return {**data, 'speechRecord': records, 'numberOfReturn': len(records)}
+
+def _normalize_search_params(params):
+    """
+    検索パラメータを正規化し、表記ゆれのある同等の検索を同じキャッシュキーにまとめる
+
+    機能:
+    - 文字列パラメータの前後の空白を除去
+    - キーワード（any）はAND検索のため、語順・重複・全角空白の違いを吸収
+
+    例:
+    - "改革　デジタル" と "デジタル 改革 デジタル" はどちらも "デジタル 改革" になる
+    """
+    normalized = {}
+    for key, value in params.items():
+        if isinstance(value, str):
+            value = value.strip()
+        if key == 'any' and value:
+            value = ' '.join(sorted(dict.fromkeys(value.split())))
+        normalized[key] = value
+    return normalized
+
+def clear_api_cache():
+    """APIレスポンスのキャッシュ（プロセス内・永続）をクリア"""
+    _fetch_speeches.clear()
+    _persistent_cache_clear()
+
+# =============================================================================
+# テキスト処理ユーティリティ
+# =============================================================================
+
+# キーワードとして採用する品詞
+_ALLOWED_POS = frozenset(['名詞', '動詞', '形容詞'])
+
+# 除外する品詞細分類
+_BLOCKED_POS2 = frozenset(['代名詞', '数', '接尾'])
+
+# 数字のみ・ひらがなのみの単語判定（1回のfullmatchで両方を判定する）
+_NUMERIC_OR_HIRAGANA = re.compile(r'\d+|[ぁ-ん]+').fullmatch
+
+@functools.lru_cache(maxsize=None)
+def _is_keyword_pos(part_of_speech):
+    """
+    品詞文字列（例: "名詞,一般,*,*"）がキーワード抽出の対象かを判定
+
+    注意事項:
+    - 品詞文字列の種類は限られるため、split結果の判定をメモ化してトークンごとの分割を省く
+    """
+    features = part_of_speech.split(',')
+    return features[0] in _ALLOWED_POS and features[1] not in _BLOCKED_POS2
+
+@functools.lru_cache(maxsize=65536)
+def _is_content_word(word):
+    """
+    表層形がキーワード候補か（ストップワード・数字のみ・ひらがなのみを除外）
+
+    注意事項:
+    - 同じ語が何度も出現するため、判定結果をメモ化して語ごとの判定を1回にする
+    """
+    return (word not in STOP_WORDS and  # ストップワード除外
+            not _NUMERIC_OR_HIRAGANA(word))  # 数字のみ・ひらがなのみ除外
+
+def _iter_keywords(tokens, min_length=2):
+    """
+    形態素解析結果からキーワードを1語ずつ生成する（中間リストを作らない）
+
+    パラメータ:
+    - tokens: Janomeのトークン列（ジェネレータ可）
+    - min_length (int): キーワードの最小文字数
+    """
+    for token in tokens:
+        # 品詞フィルタ・細分類フィルタ（除外されやすい品詞の判定を先に行う）
+        if not _is_keyword_pos(token.part_of_speech):
+            continue
+        
+        word = token.surface.strip()
+        
+        # 条件でフィルタリング（指定文字数以上・キーワード候補の語）
+        if len(word) >= min_length and _is_content_word(word):
+            yield word
+
+def _count_tokens(tokens, min_length=2):
+    """
+    形態素解析結果からキーワードを抽出し、出現回数を数える
+
+    パラメータ:
+    - tokens: Janomeのトークン列
+    - min_length (int): キーワードの最小文字数
+
+    戻り値:
+    - Counter: キーワードの出現回数
+    """
+    # トークン列をそのままCounterに流し込み、キーワードのリストを保持しない
+    return Counter(_iter_keywords(tokens, min_length))
+
+# キーワードのハイライト用タグ（スタイルはcomponents.pyの_CUSTOM_CSSで.hlクラスとして定義）
+_HIGHLIGHT_OPEN = '<span class="hl">'
+_HIGHLIGHT_CLOSE = '</span>'
+
+# 正規表現による置換テンプレート（\g<0> はマッチした文字列）
+_HIGHLIGHT_TEMPLATE = _HIGHLIGHT_OPEN + r'\g<0>' + _HIGHLIGHT_CLOSE
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _get_highlighter(keywords_key):
+    """
+    キーワードを1つの正規表現（選択パターン）にコンパイルする
+
+    パラメータ:
+    - keywords_key (tuple): 小文字化・重複除去・ソート済みのキーワード（キャッシュキー）
+
+    戻り値:
+    - re.Pattern | None: キーワードが無い場合はNone
+
+    注意事項:
+    - 語順や大文字・小文字だけが異なる検索は同じキーになり、コンパイル済みパターンを共有する
+    - 長いキーワードを優先してマッチさせるため、文字数の降順に並べる
+    - 大文字・小文字の区別が無い文字（漢字・かな等）だけならIGNORECASEを付けず、
+      ASCIIのみならASCIIの大小変換だけで照合する（Unicodeの大小変換処理を避ける）
+    """
+    if not keywords_key:
+        return None
+
+    if all(k == k.upper() for k in keywords_key):
+        flags = 0
+    elif all(k.isascii() for k in keywords_key):
+        flags = re.IGNORECASE | re.ASCII
+    else:
+        flags = re.IGNORECASE
+
+    ordered = sorted(keywords_key, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(k) for k in ordered), flags)
+
+def _highlight_single(text, keyword):
+    """
+    キーワードが1つの場合のハイライト（正規表現を使わずstr.findで走査）
+
+    戻り値:
+    - str | None: 小文字化で文字数が変わり位置を対応付けられない場合はNone
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        return None
+
+    target = keyword.lower()
+    width = len(target)
+    parts = []
+    pos = 0
+    found = lowered.find(target)
+    while found != -1:
+        parts.append(text[pos:found])
+        parts.append(_HIGHLIGHT_OPEN)
+        parts.append(text[found:found + width])
+        parts.append(_HIGHLIGHT_CLOSE)
+        pos = found + width
+        found = lowered.find(target, pos)
+    parts.append(text[pos:])
+    return "".join(parts)
+
+def _resolve_highlight(keywords_str):
+    """
+    検索1回分のハイライト設定を求める（レコードごとではなく検索ごとに1回だけ呼ぶ）
+
+    戻り値:
+    - tuple: (コンパイル済みパターン | None, 単一キーワード | None)
+    """
+    keywords = keywords_str.split() if keywords_str else []
+    if not keywords:
+        return None, None
+
+    # IGNORECASEでマッチするため、大文字・小文字違いの重複は1つにまとめる
+    # 発言本文はHTMLエスケープしてからハイライトするため、キーワードも同じ形にそろえる
+    keywords_key = tuple(sorted({html.escape(k.lower(), quote=False) for k in keywords}))
+
+    # キーワードが1つ（最も多いケース）は正規表現を使わずに置換できる
+    single = keywords_key[0] if len(keywords_key) == 1 else None
+    return _get_highlighter(keywords_key), single
+
+def _highlight_text(text, pattern, single=None):
+    """
+    テキスト内のキーワードをハイライト（全キーワードを1回の走査で置換）
+
+    パラメータ:
+    - pattern: _resolve_highlight で求めたコンパイル済みパターン（Noneならハイライトしない）
+    - single: 単一キーワードの場合はそのキーワード（str.findで置換する）
+    """
+    if pattern is None or not text:
+        return text
+
+    # 長大な発言は先頭部分のみハイライトし、処理量とHTMLの肥大化を抑える
+    tail = ''
+    if len(text) > MAX_HIGHLIGHT_CHARS:
+        text, tail = text[:MAX_HIGHLIGHT_CHARS], text[MAX_HIGHLIGHT_CHARS:]
+
+    if single is not None:
+        # 大文字・小文字の区別が無いキーワード（漢字・かな等）はstr.replaceで置換する
+        if not pattern.flags & re.IGNORECASE:
+            return text.replace(single, _HIGHLIGHT_OPEN + single + _HIGHLIGHT_CLOSE) + tail
+        highlighted = _highlight_single(text, single)
+        if highlighted is not None:
+            return highlighted + tail
+
+    return pattern.sub(_HIGHLIGHT_TEMPLATE, text) + tail
+
+def _build_speech_card_html(record, pattern, single=None):
+    """
+    検索結果1件分の表示用HTMLを生成
+
+    機能:
+    - 発言日・発言者・会議・院・文字数の表示
+    - キーワードをハイライトした発言内容（スクロール表示）
+    - 発言の全文へのリンク
+
+    注意事項:
+    - Streamlitへの描画要素を1件につき1つにまとめるため、HTML文字列として組み立てる
+    - 発言日・発言者などの項目、URL、発言本文はHTMLエスケープしてから埋め込む
+    """
+    speech_text = record['speech']
+    # 本文はエスケープしてからハイライトし、ハイライト用のタグだけがHTMLとして解釈されるようにする
+    highlighted_speech = _highlight_text(html.escape(speech_text, quote=False), pattern, single)
+
+    parts = [
+        '<p>',
+        f'<b>📅 発言日:</b> {html.escape(str(record["date"]))}<br>',
+        f'<b>👤 発言者:</b> {html.escape(str(record["speaker"]))}<br>',
+        f'<b>🏛️ 会議:</b> {html.escape(str(record["nameOfMeeting"]))}<br>',
+        f'<b>🏢 院:</b> {html.escape(str(record.get("nameOfHouse", "不明")))}<br>',
+        f'<b>📏 文字数:</b> {len(speech_text):,}',
+        '</p>',
+        '<hr>',
+        '<div class="speech-card speech-box">',
+        highlighted_speech,
+        '</div>',
+        f'<p>🔗 <a href="{html.escape(str(record["speechURL"]), quote=True)}" target="_blank">発言の全文と周辺議事を読む</a></p>',
+    ]
+    return "".join(parts)
+
+# サマリー表示のメトリックカード（1枚分）
+_METRIC_CARD_TEMPLATE = '<div class="metric-card"><h3>{title}</h3><h2>{value}</h2></div>'
+
+def _build_metric_cards_html(total_records, avg_length, unique_speakers, unique_meetings):
+    """
+    分析ページのサマリー（4枚のメトリックカード）を1つのHTMLにまとめる
+
+    注意事項:
+    - 4つのst.columnsとst.markdownの代わりに、CSSグリッド（metric-grid）で横並びにする
+    """
+    cards = (
+        ("📊 総件数", total_records),
+        ("📝 平均文字数", f"{avg_length:,}"),
+        ("👥 発言者数", unique_speakers),
+        ("🏛️ 会議数", unique_meetings),
+    )
+    return (
+        '<div class="metric-grid">'
+        + "".join(_METRIC_CARD_TEMPLATE.format(title=title, value=value) for title, value in cards)
+        + '</div>'
+    )
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _prerender_speech_cards(records_key, keywords_str, _records):
+    """
+    検索結果の表示用データ（見出し・本文HTML）をまとめて生成する
+
+    パラメータ:
+    - records_key (tuple): 検索結果の識別キー（_records_keyで生成。キャッシュキーに使用）
+    - keywords_str (str): ハイライトするキーワード
+    - _records (list): APIレスポンスのspeechRecord（発言本文をハッシュしないようキャッシュキーから除外）
+
+    戻り値:
+    - list[tuple]: (expanderの見出し, カード本文HTML) のリスト
+
+    注意事項:
+    - 描画（st.expander / st.markdown）とは分離しているため、
+      同じ検索結果の再描画ではハイライト処理を丸ごと省略できる
+    """
+    # キーワードのエスケープ・パターンのコンパイルは検索ごとに1回だけ行う
+    pattern, single = _resolve_highlight(keywords_str)
+    return [
+        (f"📝 {r['speaker']}（{r['nameOfMeeting']}）- {r['date']}",
+         _build_speech_card_html(r, pattern, single))
+        for r in _records
+    ]
+
+# =============================================================================
+# 形態素解析器の共有
+# =============================================================================
+
+@st.cache_resource(show_spinner=False)
+def _get_tokenizer():
+    """
+    Janomeトークナイザーを生成し、プロセス内で共有する
+
+    戻り値:
+    - Tokenizer | None: Janomeが利用できない場合はNone
+
+    注意事項:
+    - 辞書の読み込みは重いため、再実行（rerun）ごとに生成しない
+    """
+    try:
+        from janome.tokenizer import Tokenizer
+    except ImportError:
+        return None
+    return Tokenizer()
+
+# =============================================================================
+# 発言単位のキーワード集計キャッシュ
+# =============================================================================
+# 
+# 説明:
+# 同じ発言（speechID）が複数の検索結果に含まれる場合に形態素解析を
+# やり直さないよう、発言ごとのキーワード出現回数を保持します。
+# プロセス内で共有し、上限を超えた場合は古いものから破棄します（LRU）。
+
+# キャッシュする発言数の上限
+SPEECH_KEYWORD_CACHE_SIZE = 5000
+
+_speech_keyword_cache = OrderedDict()
+_speech_keyword_lock = threading.Lock()
+
+def _speech_keyword_cache_get(key):
+    """発言単位のキーワード集計をキャッシュから取得（存在しない場合はNone）"""
+    with _speech_keyword_lock:
+        counts = _speech_keyword_cache.get(key)
+        if counts is not None:
+            _speech_keyword_cache.move_to_end(key)
+        return counts
+
+def _speech_keyword_cache_set(key, counts):
+    """発言単位のキーワード集計をキャッシュに保存"""
+    with _speech_keyword_lock:
+        _speech_keyword_cache[key] = counts
+        _speech_keyword_cache.move_to_end(key)
+        while len(_speech_keyword_cache) > SPEECH_KEYWORD_CACHE_SIZE:
+            _speech_keyword_cache.popitem(last=False)
+
+# =============================================================================
+# キーワード集計の並列処理
+# =============================================================================
+# 
+# 説明:
+# 形態素解析はCPU負荷が高くGILを保持するため、キャッシュに無い発言が
+# 多い場合はプロセスプールで並列に解析できます（既定では無効）。
+# 各ワーカーは起動時に一度だけトークナイザーを生成します。
+# spawnで起動したワーカーはstreamlit・pandas・janomeに加えてmain.pyも
+# 読み込み直すため、メモリの限られた環境（Streamlit Cloudなど）では
+# 既定のまま同一プロセス内で解析してください。
+
+# 並列処理を行う最小の発言数（少ない場合はプロセス間通信の方が高コスト）
+PARALLEL_TOKENIZE_MIN_SPEECHES = 8
+
+# ワーカープロセス数（0の場合はプロセスプールを使わず同一プロセス内で解析する）
+# 各ワーカーがJanomeの辞書を個別に読み込むため、有効にする場合も小さな値にする
+KEYWORD_POOL_WORKERS = 0
+
+# ワーカープロセス内のトークナイザー
+_worker_tokenizer = None
+
+def _init_keyword_worker():
+    """ワーカープロセスの初期化（トークナイザーの生成）"""
+    global _worker_tokenizer
+    from janome.tokenizer import Tokenizer
+    _worker_tokenizer = Tokenizer()
+
+def _keyword_worker(args):
+    """ワーカープロセスで1発言分のキーワードを集計"""
+    speech_text, min_length = args
+    return _count_tokens(_worker_tokenizer.tokenize(speech_text), min_length)
+
+@st.cache_resource(show_spinner=False)
+def _get_keyword_pool():
+    """
+    キーワード集計用のプロセスプールを生成し、再実行間で共有する
+
+    注意事項:
+    - Streamlitのサーバーはマルチスレッドのため、forkではなくspawnでワーカーを起動する
+    """
+    return ProcessPoolExecutor(
+        max_workers=min(KEYWORD_POOL_WORKERS, os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_keyword_worker
+    )
+
+def _discard_keyword_pool():
+    """壊れたプールのワーカーを終了させてから破棄し、次回作り直す"""
+    try:
+        _get_keyword_pool().shutdown(wait=False, cancel_futures=True)
+    finally:
+        _get_keyword_pool.clear()
+
+# =============================================================================
+# ワードクラウド生成
+# =============================================================================
+
+# 日本語フォントのファイル名に含まれる文字列
+_JP_FONT_NAMES = ('noto', 'hiragino', 'yu', 'meiryo', 'msgothic')
+
+def _match_jp_font(font_paths):
+    """フォントパスの一覧から最初の日本語フォントを返す（無ければNone）"""
+    for font in font_paths:
+        lowered = font.lower()
+        if any(jp_font in lowered for jp_font in _JP_FONT_NAMES):
+            return font
+    return None
+
+@functools.lru_cache(maxsize=1)
+def _jp_font_path():
+    """
+    システムの日本語フォントのパスを探す（初回のみ走査し、結果を保持）
+
+    戻り値:
+    - str | None: 見つかったフォントのパス。見つからない場合はNone
+
+    注意事項:
+    - まずmatplotlibがキャッシュ済みのフォント一覧を参照し、
+      見つからない場合のみファイルシステムを走査する
+    """
+    fm = _lazy_wordcloud().fm
+    return (_match_jp_font(entry.fname for entry in fm.fontManager.ttflist) or
+            _match_jp_font(fm.findSystemFonts()))
+
+def _build_wordcloud(keyword_items):
+    """
+    キーワードの出現回数からワードクラウドを生成
+
+    パラメータ:
+    - keyword_items (tuple): (キーワード, 出現回数) のタプル
+    """
+    return _lazy_wordcloud().WordCloud(
+        width=800, 
+        height=400,
+        background_color='white',
+        font_path=_jp_font_path(),
+        colormap='viridis',
+        max_words=100,
+        relative_scaling=0.5,
+        random_state=42
+    ).generate_from_frequencies(dict(keyword_items))
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _wordcloud_png(keyword_items):
+    """
+    ワードクラウドをPNG画像（bytes）として生成し、再実行間で再利用する
+
+    パラメータ:
+    - keyword_items (tuple): ソート済みの (キーワード, 出現回数) タプル（キャッシュキー）
+
+    注意事項:
+    - matplotlibで描画せず、WordCloudの画像を直接PNGに変換する
+    """
+    buffer = io.BytesIO()
+    _build_wordcloud(keyword_items).to_image().save(buffer, format='PNG')
+    return buffer.getvalue()
+
+# =============================================================================
+# グラフ生成（キャッシュ付き）
+# =============================================================================
+# 
+# 説明:
+# Streamlitはウィジェット操作のたびにスクリプト全体を再実行するため、
+# 入力データが変わらない限りPlotlyの図を作り直さないようキャッシュします。
+# キャッシュキーにできるよう、引数は集計済みのDataFrameまたは
+# (ラベル, 値) のタプルで受け取ります。
+# 生成した図は描画時に変更しないため、ヒットのたびにpickleでコピーする
+# cache_dataではなく、同じオブジェクトを返すcache_resourceで共有します。
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _build_speakers_fig(speakers_df):
+    """発言者別件数の横棒グラフ（列: 発言者, 件数）"""
+    import plotly.express as px
+
+    fig = px.bar(speakers_df, x='件数', y='発言者', orientation='h',
+               color='件数', color_continuous_scale='Blues')
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _build_meetings_fig(meetings_df):
+    """会議別件数の円グラフ（列: 会議名, 件数）"""
+    import plotly.express as px
+
+    fig = px.pie(meetings_df, values='件数', names='会議名',
+               color_discrete_sequence=px.colors.qualitative.Set3)
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _build_timeline_fig(counts_df, x_label, title):
+    """発言件数の推移の折れ線グラフ（月別・日別共通、列: x_label, 件数）"""
+    import plotly.express as px
+
+    fig = px.line(counts_df, x=x_label, y='件数', 
+                 title=title,
+                 markers=True)
+    fig.update_layout(
+        height=400,
+        xaxis_title=x_label,
+        yaxis_title="発言件数"
+    )
+    return fig
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _build_keyword_bar_fig(items, title):
+    """主要キーワードの横棒グラフ"""
+    import plotly.express as px
+
+    keywords_df = pd.DataFrame(list(items), columns=['キーワード', '出現回数'])
+    fig = px.bar(
+        keywords_df, 
+        x='出現回数', 
+        y='キーワード', 
+        orientation='h',
+        title=title,
+        color='出現回数',
+        color_continuous_scale='Viridis'
+    )
+    fig.update_layout(height=600)
+    return fig
+
+def _value_distribution(values):
+    """
+    整数配列の値ごとの出現数を (値, 出現数) のタプルで返す（値の昇順）
+
+    注意事項:
+    - np.uniqueで一括集計し、グラフ生成関数のキャッシュキーに使える形に変換する
+    """
+    unique, counts = np.unique(values, return_counts=True)
+    return tuple(zip(unique.tolist(), counts.tolist()))
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _build_distribution_fig(items, x_label, title):
+    """キーワードの分布の棒グラフ（文字数分布・出現頻度分布共通）"""
+    import plotly.express as px
+
+    # itemsは_value_distributionにより値の昇順に並んでいる
+    dist_df = pd.DataFrame(list(items), columns=[x_label, '単語数'])
+    return px.bar(
+        dist_df, 
+        x=x_label, 
+        y='単語数',
+        title=title
+    )
+
+# =============================================================================
+# CSVエクスポート
+# =============================================================================
+
+def _to_csv_bytes(df):
+    """
+    DataFrameをBOM付きUTF-8のCSV（bytes）に変換
+
+    注意事項:
+    - to_csv()で文字列を返させるとencoding指定が無視されBOMが付かないため、
+      バイナリバッファに直接書き出す（Excelでの文字化け防止・str→bytesの再変換も不要）
+    """
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, encoding='utf-8-sig')
+    return buffer.getvalue()
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _cached_export_csv(records_key, _app, _data, _search_params):
+    """
+    検索結果のエクスポート用CSVをメモ化（キーは発言URLのタプル）
+
+    戻り値:
+    - bytes | None: CSVの内容。エクスポートできない場合はNone
+    """
+    export_df = _app.export_results(_data, _search_params)
+    if export_df is None:
+        return None
+    return _to_csv_bytes(export_df)
+
+# =============================================================================
+# 分析結果のキャッシュ
+# =============================================================================
+# 
+# 説明:
+# 同じ検索結果に対する分析（集計・形態素解析）を再実行しないよう、
+# 発言URLの組み合わせをキーに分析結果をメモ化します。
+# 先頭が _ の引数はStreamlitがハッシュしないため、レコード本体は
+# キーの計算に使わずそのまま渡します。
+
+def _records_key(records):
+    """検索結果の発言の組み合わせを表すキャッシュキー（発言URLのタプル）"""
+    return tuple(record.get('speechURL', '') for record in records)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_search_analytics(records_key, _app, _records):
+    """検索結果の分析結果をメモ化"""
+    return _app._compute_search_analytics(_records)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_meeting_keywords(records_key, _app, _records):
+    """会議別キーワード分析の結果をメモ化"""
+    return _app._compute_meeting_keywords(_records)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _aggregate_all_meetings(records_key, _meeting_analysis):
+    """
+    会議別キーワード分析の結果を「すべての会議」として統合し、メモ化する
+
+    戻り値:
+    - dict: 会議1件分と同じ形式（keywords, speakers, total_speeches, total_characters）
+    """
+    all_keywords = Counter()
+    all_speakers = {}  # 登場順を保った重複除去（値は使わない）
+    total_speeches = 0
+    total_characters = 0
+
+    for meeting_data in _meeting_analysis.values():
+        # キーワードを統合（上位に絞る前の集計を合算）
+        all_keywords.update(meeting_data['keyword_counts'])
+
+        # 発言者を統合
+        all_speakers.update(dict.fromkeys(meeting_data['speakers']))
+        total_speeches += meeting_data['total_speeches']
+        total_characters += meeting_data['total_characters']
+
+    keywords = dict(all_keywords.most_common(TOP_KEYWORDS))
+    return {
+        'keywords': keywords,
+        'keywords_lower': tuple(k.lower() for k in keywords),
+        'speakers': list(all_speakers),
+        'speakers_text': "、".join(all_speakers),
+        'total_speeches': total_speeches,
+        'total_characters': total_characters,
+        'avg_characters': total_characters // max(1, total_speeches)
+    }
+
+def _build_meeting_view(meeting_data):
+    """
+    会議別キーワード分析ページの表示用データ（会議ごとに不変）をまとめて計算する
+
+    戻り値:
+    - dict: 会議データ（meeting）、上位20件（top20）、上位15件の一覧、文字数分布・出現頻度分布、統計サマリーの値
+    """
+    keywords = meeting_data['keywords']
+    # キーワード長別分布・出現頻度分布（NumPy配列で一括集計）
+    keyword_lengths = np.fromiter(map(len, keywords), dtype=np.int32, count=len(keywords))
+    frequencies = np.fromiter(keywords.values(), dtype=np.int64, count=len(keywords))
+    total_keywords = len(keywords)
+    total_occurrences = int(frequencies.sum())
+    return {
+        'meeting': meeting_data,
+        # keywordsは出現回数の降順に並んでいるため、先頭から取り出すだけでよい
+        'top20': tuple(islice(keywords.items(), 20)),
+        # キーワード一覧（上位15件）は1回のst.markdownで表示できるよう連結しておく
+        'top15_markdown': "\n".join(
+            f"{i:2d}. **{keyword}** ({count}回)"
+            for i, (keyword, count) in enumerate(islice(keywords.items(), 15), 1)
+        ),
+        'length_distribution': _value_distribution(keyword_lengths),
+        'frequency_distribution': _value_distribution(frequencies),
+        'total_keywords': total_keywords,
+        'total_occurrences': total_occurrences,
+        'avg_occurrence': total_occurrences / total_keywords if total_keywords > 0 else 0
+    }
+
+# =============================================================================
+# 検索履歴の保存形式と読み込み
+# =============================================================================
+
+# 検索履歴の保存先と列
+SEARCH_HISTORY_CSV = 'search_history.csv'
+_HISTORY_FIELDS = ('timestamp', 'params', 'results_count')
+
+# 検索履歴ページで1ページに表示する件数
+HISTORY_PAGE_SIZE = 20
+
+def _history_key(params):
+    """検索パラメータから履歴の重複判定用キーを生成（キーの順序に依存しない）"""
+    return json.dumps(params, sort_keys=True, ensure_ascii=False)
+
+def _history_row(item):
+    """履歴アイテムをCSVの1行分（パラメータはJSON文字列）に変換"""
+    return {
+        'timestamp': item.get('timestamp', ''),
+        'params': json.dumps(item.get('params', {}), ensure_ascii=False),
+        'results_count': item.get('results_count', 0)
+    }
+
+def _parse_history_params(value):
+    """paramsカラムの値（JSON文字列）を辞書に変換（解析できない場合は空の辞書）"""
+    if not isinstance(value, str):
+        return {}
+    try:
+        return _json_loads(value)
+    except ValueError:
+        return {}
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _read_search_history(csv_file, mtime):
+    """
+    検索履歴CSVを読み込み、履歴アイテムのリストに変換する
+    
+    パラメータ:
+    - csv_file (str): CSVファイルのパス
+    - mtime (float): ファイルの更新時刻（キャッシュキー。ファイルが更新されると読み直す）
+    
+    注意事項:
+    - 更新時刻は検索のたびに変わるため、メモリ上のキャッシュは最新の1件のみ保持する
+      （ディスクには保存しない。ファイルが更新されるたびに古い読み込み結果が残り続けるため）
+    - 行ごとのiterrowsを使わず、列単位で変換してからレコードのリストにする
+    - 同じ検索条件の行は後から追記されたものを優先する（最初に現れた位置は保つ）
+    """
+    df = pd.read_csv(csv_file, encoding='utf-8-sig')
+    df = df.reindex(columns=list(_HISTORY_FIELDS))
+    df = df.fillna({'timestamp': '', 'results_count': 0})
+    
+    # paramsカラムをJSONから辞書に変換（列単位で一括変換、orjsonがあれば使用）
+    df['params'] = df['params'].map(_parse_history_params)
+    df['results_count'] = pd.to_numeric(df['results_count'], errors='coerce').fillna(0).astype(int)
+    
+    latest = {}
+    for history_item in df.to_dict('records'):
+        latest[_history_key(history_item['params'])] = history_item
+    return list(latest.values())
+
+def load_search_history():
+    """
+    検索履歴をCSVファイルから読み込む関数
+    
+    機能:
+    - search_history.csvファイルから検索履歴を読み込み
+    - JSON形式で保存されたパラメータを辞書形式に変換
+    - エラーハンドリングによる安全な読み込み
+    - ファイルが更新されていなければ前回の読み込み結果を再利用
+    
+    戻り値:
+    - list: 検索履歴のリスト（辞書形式）
+    
+    エラー処理:
+    - ファイルが存在しない場合: 空のリストを返す
+    - 読み込みエラーの場合: 警告を表示して空のリストを返す
+    """
+    csv_file = SEARCH_HISTORY_CSV
+    if os.path.exists(csv_file):
+        try:
+            history_list = _read_search_history(csv_file, os.path.getmtime(csv_file))
+            st.success(f"✅ 検索履歴を正常に読み込みました（{len(history_list)}件）")
+            return history_list
+            
+        except Exception as e:
+            st.warning(f"⚠️ 検索履歴の読み込みに失敗しました: {e}")
+            return []
+    else:
+        st.info("ℹ️ 検索履歴ファイルが見つかりません。新しい履歴から開始します。")
+        return []
+
 # =============================================================================
 # メインアプリケーションクラス
 # =============================================================================
@@ -104,14 +1144,12 @@ class KokkaiSearchApp:
     
     属性:
     - tokenizer: Janomeトークナイザー（オプション）
-    - stop_words: ストップワードセット
     - session_state: Streamlitセッション状態
     
     メソッド:
     - __init__: 初期化
     - search_speeches: 議事録検索
     - analyze_search_results: 検索結果分析
-    - extract_keywords: キーワード抽出
     - create_visualizations: 可視化作成
     - 各ページ表示メソッド
     """
@@ -122,10 +1160,12 @@ class KokkaiSearchApp:
         
         機能:
         - セッション状態の初期化
-        - Janomeトークナイザーの初期化（利用可能な場合）
-        - ストップワードの設定
         - 基本設定の読み込み
         
+        注意事項:
+        - Janomeトークナイザーは初回使用時に生成する（tokenizerプロパティ）
+        - ストップワードはモジュール定数STOP_WORDSを使用する
+        
         セッション状態:
         - search_history: 検索履歴
         - search_results: 検索結果
@@ -148,56 +1188,24 @@ class KokkaiSearchApp:
         if 'analytics_data' not in st.session_state:
             st.session_state.analytics_data = {}
         
-        # =====================================================================
-        # Janome初期化（利用可能な場合のみ）
-        # =====================================================================
-        
-        # Janomeライブラリの利用可能性をチェック
-        try:
-            from janome.tokenizer import Tokenizer
-            self.tokenizer = Tokenizer()
-            
-            # ストップワード（除外する単語）の定義
-            # 日本語の議事録に特化したストップワードセット
-            self.stop_words = {
-                # 基本動詞・助動詞
-                'する', 'ある', 'いる', 'なる', 'れる', 'られる', 'せる', 'させる',
-                
-                # 指示詞・接続詞
-                'この', 'その', 'あの', 'どの', 'という', 'といった', 'として', 'について',
-                'において', 'に対して', 'というふうに', 'だと', 'である', 'です', 'ます',
-                
-                # 助詞・副詞
-                'でき', 'よう', 'もの', 'こと', '場合', '中', 'ため', 'から', 'まで',
-                
-                # 人称代名詞
-                '私', '我々', '皆さん', '皆様', 'あなた', 'あなた方',
-                
-                # 時間表現
-                '今', '現在', '今回', '今度', '先ほど', '先程', '本日', '今日', '昨日', '明日',
-                '時間', '分', '秒', '年', '月', '日', '週', '回', '度', '番', '号',
-                
-                # 応答表現
-                'はい', 'いえ', 'ええ', 'うん', 'そう', 'いや', 'まあ', 'ちょっと', 'やはり', 'やっぱり',
-                
-                # 役職・敬称
-                '委員', '大臣', '議員', '先生', '総理', '副', '会長', '理事', '長', '部長', '課長',
-                '様', 'さん', '氏', '君',
-                
-                # 法律・制度関連
-                '第', '章', '条', '項', '法', '法律', '制度', '政策',
-                
-                # 思考・感情表現
-                '思う', '考える', '感じる', '見る', '聞く', '言う', '話す', '述べる', '申し上げる',
-                '知る', '分かる', '理解する', '説明する', '報告する',
-                
-                # その他
-                'など', 'とか', 'やら', 'かも', 'かもしれない', 'でしょう', 'かもしれません'
+        # 検索履歴の索引（パラメータ → 履歴内の位置）の初期化
+        if 'search_history_index' not in st.session_state:
+            st.session_state.search_history_index = {
+                _history_key(item.get('params', {})): i
+                for i, item in enumerate(st.session_state.search_history)
             }
-        except ImportError:
-            # Janomeが利用できない場合は空のセットを使用
-            self.tokenizer = None
-            self.stop_words = set()
+
+    @property
+    def tokenizer(self):
+        """
+        Janomeトークナイザー（共有インスタンス）
+
+        初回アクセス時に辞書を読み込んで生成する。
+        Janomeが利用できない場合はNone。
+        """
+        if not JANOME_AVAILABLE:
+            return None
+        return _get_tokenizer()
 
     # =============================================================================
     # 検索履歴管理メソッド
@@ -222,17 +1230,11 @@ class KokkaiSearchApp:
         if st.session_state.search_history:
             try:
                 # 検索履歴をDataFrameに変換
-                history_data = []
-                for item in st.session_state.search_history:
-                    history_data.append({
-                        'timestamp': item.get('timestamp', ''),
-                        'params': json.dumps(item.get('params', {}), ensure_ascii=False),
-                        'results_count': item.get('results_count', 0)
-                    })
+                history_data = [_history_row(item) for item in st.session_state.search_history]
                 
                 # DataFrameを作成してCSVに保存
                 df = pd.DataFrame(history_data)
-                df.to_csv('search_history.csv', index=False, encoding='utf-8-sig')
+                df.to_csv(SEARCH_HISTORY_CSV, index=False, encoding='utf-8-sig')
                 
                 st.success("✅ 検索履歴を正常に保存しました")
                 return True
@@ -244,15 +1246,41 @@ class KokkaiSearchApp:
             st.info("ℹ️ 保存する検索履歴がありません")
             return False
 
+    def append_search_history_to_csv(self, item):
+        """
+        検索履歴の1件をCSVファイルの末尾に追記
+        
+        機能:
+        - ファイル全体を書き直さず、1行だけを書き込む
+        - ファイルが無い場合はヘッダー付きで新規作成
+        - 新しい検索条件の追加に使う（既存の検索条件の更新は save_search_history_to_csv で書き直す）
+        
+        戻り値:
+        - bool: 保存成功時True、失敗時False
+        """
+        try:
+            write_header = not os.path.exists(SEARCH_HISTORY_CSV)
+            # 追記位置が先頭でない場合、utf-8-sigでもBOMは書き込まれない
+            with open(SEARCH_HISTORY_CSV, 'a', newline='', encoding='utf-8-sig') as f:
+                writer = csv.DictWriter(f, fieldnames=_HISTORY_FIELDS)
+                if write_header:
+                    writer.writeheader()
+                writer.writerow(_history_row(item))
+            st.success("✅ 検索履歴を正常に保存しました")
+            return True
+        except Exception as e:
+            st.error(f"❌ 検索履歴の保存に失敗しました: {e}")
+            return False
+
     def add_to_search_history(self, search_params, results_count):
         """
         検索履歴に追加してCSVに保存
         
         機能:
         - 新しい検索条件と結果数を履歴に追加
-        - 重複チェック（同じパラメータの場合は更新）
-        - タイムスタンプの自動付与
-        - CSVファイルへの自動保存
+        - 重複チェック（同じパラメータの場合は更新、索引により定数時間で判定）
+        - タイムスタンプの自動付与（更新時は最初に検索した日時を保持）
+        - CSVファイルへの自動保存（追加は1行の追記、結果数が変わった更新はファイル全体を書き直して重複行を残さない）
         
         パラメータ:
         - search_params (dict): 検索パラメータ
@@ -265,77 +1293,62 @@ class KokkaiSearchApp:
         4. CSVファイルへの保存
         """
         
-        # デバッグ情報の表示
-        st.write(f"💾 検索履歴に保存: {search_params}")
+        # 重複チェック（同じパラメータの場合は更新）
+        history_index = st.session_state.search_history_index
+        key = _history_key(search_params)
+        existing_index = history_index.get(key)
         
         # 新しい履歴アイテムの作成
         search_history_item = {
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
             'params': search_params,
             'results_count': results_count
         }
         
-        # 重複チェック（同じパラメータの場合は更新）
-        existing_index = None
-        for i, item in enumerate(st.session_state.search_history):
-            if item.get('params') == search_params:
-                existing_index = i
-                break
-        
         if existing_index is not None:
-            # 既存の履歴を更新
+            # 既存の履歴を更新（最初に検索した日時は保持する）
+            previous_item = st.session_state.search_history[existing_index]
+            search_history_item['timestamp'] = previous_item['timestamp']
             st.session_state.search_history[existing_index] = search_history_item
             st.info("🔄 既存の検索履歴を更新しました")
+            
+            # 結果数が変わった場合のみ、CSVを書き直して同じ検索条件の行を1行にまとめる
+            if previous_item['results_count'] != results_count:
+                self.save_search_history_to_csv()
         else:
             # 新しい履歴を追加
+            history_index[key] = len(st.session_state.search_history)
             st.session_state.search_history.append(search_history_item)
             st.success("✅ 新しい検索履歴を追加しました")
-        
-        # CSVファイルに保存
-        self.save_search_history_to_csv()
+            
+            # CSVファイルには1行だけ追記
+            self.append_search_history_to_csv(search_history_item)
 
     def clear_search_history(self):
         """検索履歴をクリア"""
         st.session_state.search_history = []
+        st.session_state.search_history_index = {}
         # CSVファイルを削除
-        if os.path.exists('search_history.csv'):
+        if os.path.exists(SEARCH_HISTORY_CSV):
             try:
-                os.remove('search_history.csv')
+                os.remove(SEARCH_HISTORY_CSV)
                 st.success("検索履歴をクリアしました。")
             except Exception as e:
                 st.error(f"検索履歴のクリアに失敗しました: {e}")
 
-    def highlight_text(self, text, keywords_str):
-        """テキスト内のキーワードをハイライト"""
-        if not keywords_str or not text:
-            return text
-
-        keywords = keywords_str.split()
-        highlighted_text = text
-
-        for keyword in keywords:
-            highlighted_text = re.sub(
-                re.escape(keyword), 
-                lambda m: f'<span style="background-color: #fff3cd; padding: 2px 4px; border-radius: 3px; font-weight: bold;">{m.group(0)}</span>', 
-                highlighted_text, 
-                flags=re.IGNORECASE
-            )
-        return highlighted_text
-
-    def search_speeches(self, params):
-        """国会会議録API検索"""
+    def search_speeches(self, params, max_records=DEFAULT_FETCH_RECORDS):
+        """国会会議録API検索（max_records件まで、2ページ目以降は並列取得）"""
         try:
+            # 1ページの件数は取得件数に合わせ、APIの上限（100件）まで増やして呼び出し回数を減らす
             api_params = {
-                "maximumRecords": 30,
+                "maximumRecords": max(1, min(API_MAX_PAGE_SIZE, int(max_records))),
                 "recordPacking": "json"
             }
-            api_params.update(params)
-            
-            response = requests.get(API_URL, params=api_params, timeout=15.0)
-            response.raise_for_status()
-            
-            if response.text:
-                return response.json()
+            api_params.update(_normalize_search_params(params))
+
+            # 辞書はハッシュできないため、ソート済みタプルをキャッシュキーにする
+            return _fetch_speeches(tuple(sorted(api_params.items())), int(max_records))
+        except _EmptyResponse:
             return None
         except requests.exceptions.RequestException as e:
             st.error(f"APIへの接続中にエラーが発生しました: {e}")
@@ -344,153 +1357,203 @@ class KokkaiSearchApp:
             st.error("APIからの応答が不正な形式です。")
             return None
 
-    def extract_keywords(self, text, min_length=2, top_n=50):
-        """janomeを使って形態素解析し、キーワードを抽出"""
-        if not self.tokenizer or not text:
-            return {}
-        
-        keywords = []
-        
-        # テキストを形態素解析
-        tokens = self.tokenizer.tokenize(text)
-        
-        for token in tokens:
-            # 品詞情報を取得
-            features = token.part_of_speech.split(',')
-            word = token.surface.strip()
-            
-            # 条件でフィルタリング
-            if (len(word) >= min_length and  # 指定文字数以上
-                word not in self.stop_words and  # ストップワード除外
-                not word.isdigit() and  # 数字のみ除外
-                features[0] in ['名詞', '動詞', '形容詞'] and  # 品詞フィルタ
-                features[1] not in ['代名詞', '数', '接尾'] and  # 細分類フィルタ
-                not re.match(r'^[ぁ-ん]+$', word)):  # ひらがなのみ除外
-                
-                # 動詞の場合は原形に変換
-                if features[0] == '動詞' and len(features) >= 7 and features[6] != '*':
-                    keywords.append(features[6])
-                else:
-                    keywords.append(word)
-        
-        # 単語の出現回数をカウント
-        keyword_counts = Counter(keywords)
-        return dict(keyword_counts.most_common(top_n))
+    def _count_keywords(self, text, min_length=2):
+        """形態素解析を行い、キーワードの出現回数（Counter）を返す"""
+        return _count_tokens(self.tokenizer.tokenize(text), min_length)
+
+    def _prefetch_speech_keywords(self, records, min_length=2):
+        """
+        キャッシュに無い発言のキーワード集計をプロセスプールで並列に実行
+
+        注意事項:
+        - プロセスプールが無効な場合、対象が少ない場合やCPUが1コアの場合は何もしない（逐次処理に任せる）
+        - プールが利用できない場合も逐次処理にフォールバックする
+        """
+        self._collect_keyword_prefetch(self._submit_keyword_prefetch(records, min_length))
+
+    def _submit_keyword_prefetch(self, records, min_length=2):
+        """
+        未キャッシュの発言の解析をプロセスプールに投入し、完了を待たずに戻る
+
+        戻り値:
+        - tuple | None: (min_length, 発言IDのリスト, 結果のイテレータ)。投入しなかった場合はNone
+        """
+        # プロセスプールが無効な場合やCPUが1コアの場合は逐次処理に任せる
+        if KEYWORD_POOL_WORKERS < 1 or (os.cpu_count() or 1) < 2:
+            return None
+
+        # 未キャッシュの発言（同一speechIDは1回だけ解析）
+        misses = {}
+        for record in records:
+            speech_id = record.get('speechID')
+            if speech_id and speech_id not in misses and \
+                    _speech_keyword_cache_get((speech_id, min_length)) is None:
+                misses[speech_id] = record.get('speech', '')
+
+        if len(misses) < PARALLEL_TOKENIZE_MIN_SPEECHES:
+            return None
+
+        try:
+            # Executor.mapは呼び出し時に全タスクを投入し、結果の取り出し時にだけ待機する
+            results = _get_keyword_pool().map(
+                _keyword_worker,
+                [(speech_text, min_length) for speech_text in misses.values()],
+                chunksize=1
+            )
+        except Exception:
+            # 壊れたプールは破棄し、次回作り直す
+            _discard_keyword_pool()
+            return None
+        return min_length, list(misses), results
+
+    def _collect_keyword_prefetch(self, pending):
+        """_submit_keyword_prefetch で投入した解析の結果を待ち、発言単位のキャッシュに格納"""
+        if pending is None:
+            return
+
+        min_length, speech_ids, results = pending
+        try:
+            for speech_id, counts in zip(speech_ids, results):
+                _speech_keyword_cache_set((speech_id, min_length), counts)
+        except Exception:
+            # 壊れたプールは破棄し、次回作り直す（未取得分は逐次処理で補う）
+            _discard_keyword_pool()
+
+    def _keywords_for_speech(self, speech_id, speech_text, min_length=2):
+        """
+        1発言分のキーワード出現回数を取得（speechID単位でキャッシュ）
+
+        パラメータ:
+        - speech_id (str): 発言ID（空の場合はキャッシュしない）
+        - speech_text (str): 発言内容
+        - min_length (int): キーワードの最小文字数
+
+        戻り値:
+        - Counter: キーワードの出現回数（キャッシュと共有のため変更しないこと）
+        """
+        if not speech_id:
+            return self._count_keywords(speech_text, min_length)
+
+        key = (speech_id, min_length)
+        counts = _speech_keyword_cache_get(key)
+        if counts is None:
+            counts = self._count_keywords(speech_text, min_length)
+            _speech_keyword_cache_set(key, counts)
+        return counts
 
     def analyze_meeting_keywords(self, data):
-        """会議別のキーワード分析"""
+        """会議別のキーワード分析（同じ発言の組み合わせは前回の結果を再利用）"""
         if not data or "speechRecord" not in data:
             return {}
         
         records = data["speechRecord"]
+        return _cached_meeting_keywords(_records_key(records), self, records)
+
+    def _compute_meeting_keywords(self, records):
+        """会議別のキーワード分析の本体（キャッシュされていない場合に実行）"""
         meeting_analysis = {}
         
-        # 会議別に発言をグループ化
-        meeting_groups = {}
-        for record in records:
-            meeting_name = record.get('nameOfMeeting', '不明')
-            if meeting_name not in meeting_groups:
-                meeting_groups[meeting_name] = []
-            meeting_groups[meeting_name].append(record)
+        # 未解析の発言をまとめて並列解析（結果は発言単位のキャッシュに格納）
+        self._prefetch_speech_keywords(records)
+        
+        # 会議別に発言をグループ化（列単位で1回の走査）
+        df = pd.DataFrame.from_records(
+            records,
+            columns=['speechID', 'nameOfMeeting', 'speaker', 'speech']
+        ).fillna({'speechID': '', 'nameOfMeeting': '不明', 'speaker': '不明', 'speech': ''})
         
         # 各会議のキーワード分析
-        for meeting_name, meeting_records in meeting_groups.items():
-            # 全発言を結合
-            all_speeches = ' '.join([record.get('speech', '') for record in meeting_records])
+        for meeting_name, meeting_df in df.groupby('nameOfMeeting', sort=False):
+            # キーワード抽出（発言単位の集計を合算）
+            keyword_counts = Counter()
+            for speech_id, speech_text in zip(meeting_df['speechID'], meeting_df['speech']):
+                keyword_counts.update(self._keywords_for_speech(speech_id, speech_text))
+            keywords = dict(keyword_counts.most_common(TOP_KEYWORDS))
             
-            # キーワード抽出
-            keywords = self.extract_keywords(all_speeches)
+            # 発言者リスト（登場順を保って重複を除く）
+            speakers = list(dict.fromkeys(meeting_df['speaker']))
             
-            # 発言者リスト
-            speakers = list(set([record.get('speaker', '不明') for record in meeting_records]))
+            total_speeches = len(meeting_df)
+            total_characters = int(meeting_df['speech'].str.len().sum())
             
             meeting_analysis[meeting_name] = {
                 'keywords': keywords,
+                # キーワード検索用に小文字化したキーワード（keywordsと同じ順序）
+                'keywords_lower': tuple(k.lower() for k in keywords),
+                # 全会議の統合用に、上位に絞る前の集計も保持する
+                'keyword_counts': keyword_counts,
                 'speakers': speakers,
-                'total_speeches': len(meeting_records),
-                'total_characters': len(all_speeches),
-                'speeches': meeting_records
+                # 表示用に連結した発言者一覧（再実行ごとに連結し直さない）
+                'speakers_text': "、".join(speakers),
+                'total_speeches': total_speeches,
+                'total_characters': total_characters,
+                'avg_characters': total_characters // max(1, total_speeches)
             }
         
         return meeting_analysis
 
     def create_wordcloud(self, keywords):
-        """ワードクラウドを生成"""
+        """ワードクラウドを生成（PNG画像のbytesを返す）"""
         if not keywords:
             return None
         
         # WordCloudライブラリの利用可能性をチェック
-        try:
-            from wordcloud import WordCloud
-            import matplotlib.pyplot as plt
-            import matplotlib.font_manager as fm
-            import numpy as np
-        except ImportError:
+        if _lazy_wordcloud() is None:
             st.warning("⚠️ WordCloudライブラリがインストールされていません。ワードクラウド機能は無効です。")
             return None
         
         try:
-            # 日本語フォントの設定
-            font_path = None
-            # システムの日本語フォントを探す
-            fonts = fm.findSystemFonts()
-            for font in fonts:
-                if any(jp_font in font.lower() for jp_font in ['noto', 'hiragino', 'yu', 'meiryo', 'msgothic']):
-                    font_path = font
-                    break
-            
-            wordcloud = WordCloud(
-                width=800, 
-                height=400,
-                background_color='white',
-                font_path=font_path,
-                colormap='viridis',
-                max_words=100,
-                relative_scaling=0.5,
-                random_state=42
-            ).generate_from_frequencies(keywords)
-            
-            return wordcloud
+            # 同じキーワード集計の場合はキャッシュ済みの画像を再利用
+            return _wordcloud_png(tuple(sorted(keywords.items())))
         except Exception as e:
             st.warning(f"ワードクラウドの生成に失敗しました: {e}")
             return None
 
     def analyze_search_results(self, data):
-        """検索結果の分析"""
+        """検索結果の分析（同じ発言の組み合わせは前回の結果を再利用）"""
         if not data or "speechRecord" not in data:
             return {}
         
         records = data["speechRecord"]
+        return _cached_search_analytics(_records_key(records), self, records)
+
+    def _compute_search_analytics(self, records):
+        """検索結果の分析の本体（キャッシュされていない場合に実行）"""
+        # レコードをDataFrameに変換（列単位のベクトル演算で集計）
+        df = pd.DataFrame.from_records(
+            records,
+            columns=['speaker', 'nameOfMeeting', 'date', 'speech']
+        )
         
         # 発言者の分析
-        speakers = [record.get('speaker', '不明') for record in records]
-        speaker_counts = Counter(speakers)
+        speaker_counts = df['speaker'].fillna('不明').value_counts().head(10)
         
         # 会議の分析
-        meetings = [record.get('nameOfMeeting', '不明') for record in records]
-        meeting_counts = Counter(meetings)
+        meeting_counts = df['nameOfMeeting'].fillna('不明').value_counts().head(10)
         
-        # 日付の分析
-        dates = []
-        for record in records:
-            date_str = record.get('date', '')
-            if date_str:
-                try:
-                    date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-                    dates.append(date_obj)
-                except:
-                    pass
+        # 日付の分析（解析できない日付は除外）
+        dates = pd.to_datetime(df['date'], format='%Y-%m-%d', errors='coerce', cache=True).dropna().reset_index(drop=True)
+        
+        # 月別件数（行ごとに文字列化せず、期間単位で集計してから見出しだけ文字列化）
+        monthly_counts = dates.dt.to_period('M').value_counts().sort_index()
+        monthly_counts.index = monthly_counts.index.astype(str)
         
         # 発言の長さ分析
-        speech_lengths = [len(record.get('speech', '')) for record in records]
+        speech_lengths = df['speech'].fillna('').str.len().to_numpy()
         
         return {
-            'total_records': len(records),
-            'speaker_counts': dict(speaker_counts.most_common(10)),
-            'meeting_counts': dict(meeting_counts.most_common(10)),
+            'total_records': len(df),
+            'speaker_counts': speaker_counts.to_dict(),
+            'meeting_counts': meeting_counts.to_dict(),
             'dates': dates,
+            # グラフ用のDataFrame（再実行ごとに作り直さないよう分析結果と一緒に保持）
+            'speakers_df': speaker_counts.rename_axis('発言者').reset_index(name='件数'),
+            'meetings_df': meeting_counts.rename_axis('会議名').reset_index(name='件数'),
+            'monthly_df': monthly_counts.rename_axis('年月').reset_index(name='件数'),
+            'daily_df': dates.value_counts().sort_index()
+                             .rename_axis('日付').reset_index(name='件数'),
             'speech_lengths': speech_lengths,
-            'avg_speech_length': sum(speech_lengths) / len(speech_lengths) if speech_lengths else 0
+            'avg_speech_length': float(speech_lengths.mean()) if speech_lengths.size else 0
         }
 
     def create_visualizations(self, analytics):
@@ -503,70 +1566,34 @@ class KokkaiSearchApp:
         with col1:
             if analytics.get('speaker_counts'):
                 st.subheader("📊 発言者別件数")
-                speakers_df = pd.DataFrame(
-                    list(analytics['speaker_counts'].items()), 
-                    columns=['発言者', '件数']
-                )
-                fig = px.bar(speakers_df, x='件数', y='発言者', orientation='h',
-                           color='件数', color_continuous_scale='Blues')
-                fig.update_layout(height=400)
+                fig = _build_speakers_fig(analytics['speakers_df'])
                 st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             if analytics.get('meeting_counts'):
                 st.subheader("🏛️ 会議別件数")
-                meetings_df = pd.DataFrame(
-                    list(analytics['meeting_counts'].items()), 
-                    columns=['会議名', '件数']
-                )
-                fig = px.pie(meetings_df, values='件数', names='会議名',
-                           color_discrete_sequence=px.colors.qualitative.Set3)
-                fig.update_layout(height=400)
+                fig = _build_meetings_fig(analytics['meetings_df'])
                 st.plotly_chart(fig, use_container_width=True)
         
         # 時系列分析
-        if analytics.get('dates'):
+        dates = analytics.get('dates')
+        if dates is not None and len(dates) > 0:
             st.subheader("📅 時系列分析")
-            dates_df = pd.DataFrame({'日付': analytics['dates']})
             
             # デバッグ情報を表示
-            st.write(f"📊 検索結果の日付範囲: {min(dates_df['日付'])} 〜 {max(dates_df['日付'])}")
-            st.write(f"📊 総日数: {len(dates_df)}日")
-            
-            # 日付を年月に変換（より確実な方法）
-            dates_df['年月'] = dates_df['日付'].dt.strftime('%Y-%m')
-            monthly_counts = dates_df.groupby('年月').size().reset_index(name='件数')
+            st.write(f"📊 検索結果の日付範囲: {dates.min()} 〜 {dates.max()}")
+            st.write(f"📊 総日数: {len(dates)}日")
             
             # データが複数月にわたる場合のみ表示
-            if len(monthly_counts) > 1:
-                # 年月でソート
-                monthly_counts = monthly_counts.sort_values('年月')
-                
-                fig = px.line(monthly_counts, x='年月', y='件数', 
-                             title='月別発言件数の推移',
-                             markers=True)
-                fig.update_layout(
-                    height=400,
-                    xaxis_title="年月",
-                    yaxis_title="発言件数"
-                )
+            if len(analytics['monthly_df']) > 1:
+                fig = _build_timeline_fig(analytics['monthly_df'], '年月', '月別発言件数の推移')
                 st.plotly_chart(fig, use_container_width=True)
             else:
                 st.info("📊 時系列分析には複数月のデータが必要です。現在の検索結果は1ヶ月のみです。")
                 
                 # 1ヶ月のみの場合でも、日別の推移を表示
                 st.subheader("📅 日別発言件数の推移")
-                daily_counts = dates_df.groupby('日付').size().reset_index(name='件数')
-                daily_counts = daily_counts.sort_values('日付')
-                
-                fig = px.line(daily_counts, x='日付', y='件数', 
-                             title='日別発言件数の推移',
-                             markers=True)
-                fig.update_layout(
-                    height=400,
-                    xaxis_title="日付",
-                    yaxis_title="発言件数"
-                )
+                fig = _build_timeline_fig(analytics['daily_df'], '日付', '日別発言件数の推移')
                 st.plotly_chart(fig, use_container_width=True)
 
     def export_results(self, data, search_params):
@@ -574,22 +1601,59 @@ class KokkaiSearchApp:
         if not data or "speechRecord" not in data:
             return None
         
-        records = data["speechRecord"]
-        export_data = []
+        # 必要な列だけを取り出して日本語の列名に変換
+        df = pd.DataFrame.from_records(
+            data["speechRecord"],
+            columns=['date', 'speaker', 'nameOfMeeting', 'nameOfHouse', 'speech', 'speechURL']
+        ).fillna('').rename(columns={
+            'date': '発言日',
+            'speaker': '発言者',
+            'nameOfMeeting': '会議名',
+            'nameOfHouse': '院名',
+            'speech': '発言内容',
+            'speechURL': 'URL'
+        })
+        
+        # 発言内容は500文字を超える場合に切り詰める（列単位で一括処理）
+        speech = df['発言内容']
+        df['発言内容'] = speech.where(speech.str.len() <= 500, speech.str.slice(0, 500) + '...')
         
-        for record in records:
-            export_data.append({
-                '発言日': record.get('date', ''),
-                '発言者': record.get('speaker', ''),
-                '会議名': record.get('nameOfMeeting', ''),
-                '院名': record.get('nameOfHouse', ''),
-                '発言内容': record.get('speech', '')[:500] + '...' if len(record.get('speech', '')) > 500 else record.get('speech', ''),
-                'URL': record.get('speechURL', '')
-            })
-        
-        df = pd.DataFrame(export_data)
         return df
 
+    def render_search_results(self, data, search_params):
+        """
+        検索結果（CSVダウンロードボタンと発言カード）を表示
+        
+        パラメータ:
+        - data (dict): APIレスポンス
+        - search_params (dict): 検索条件（キーワードのハイライトに使用）
+        """
+        # エクスポート機能（同じ検索結果のCSVは再生成しない）
+        csv = _cached_export_csv(_records_key(data["speechRecord"]), self, data, search_params)
+        if csv is not None:
+            st.download_button(
+                label="📄 検索結果をCSVでダウンロード",
+                data=csv,
+                file_name=f"kokkai_search_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                mime="text/csv"
+            )
+        
+        # 検索結果表示
+        self.render_speech_cards(data["speechRecord"], search_params.get('any', ''))
+
+    def render_speech_cards(self, records, keywords_str):
+        """
+        検索結果の発言カードを表示
+        
+        注意事項:
+        - 表示用HTMLは _prerender_speech_cards で先にまとめて生成（キャッシュ済み）し、
+          描画ループでは出力のみ行う
+        """
+        for title, card_html in _prerender_speech_cards(_records_key(records), keywords_str, records):
+            with st.expander(title):
+                # 発言情報・ハイライト済み発言内容・リンクを1回の描画で表示
+                st.markdown(card_html, unsafe_allow_html=True)
+
     def search_page(self):
         st.markdown('<h2 class="sub-header">🔍 国会議事録検索</h2>', unsafe_allow_html=True)
         
@@ -651,8 +1715,8 @@ class KokkaiSearchApp:
                 from_date = None
                 if from_date_str:
                     try:
-                        from_date = datetime.strptime(from_date_str, '%Y-%m-%d').date()
-                    except:
+                        from_date = date.fromisoformat(from_date_str)
+                    except ValueError:
                         from_date = None
                 from_date = st.date_input("📅 検索期間（開始日）", value=from_date)
             with col5:
@@ -660,11 +1724,22 @@ class KokkaiSearchApp:
                 until_date = None
                 if until_date_str:
                     try:
-                        until_date = datetime.strptime(until_date_str, '%Y-%m-%d').date()
-                    except:
+                        until_date = date.fromisoformat(until_date_str)
+                    except ValueError:
                         until_date = None
                 until_date = st.date_input("📅 検索期間（終了日）", value=until_date)
             
+            # 取得件数（2ページ目以降はまとめて並列に取得する）
+            fetch_limit = st.number_input(
+                "📥 取得件数",
+                min_value=1,
+                max_value=MAX_FETCH_RECORDS,
+                value=DEFAULT_FETCH_RECORDS,
+                step=10,
+                key="fetch_limit",
+                help=f"1回の検索で取得する発言の件数（最大{MAX_FETCH_RECORDS}件）"
+            )
+            
             search_button = st.form_submit_button("🔍 検索実行", type="primary")
         
         # 自動検索フラグがある場合は自動的に検索を実行
@@ -685,12 +1760,15 @@ class KokkaiSearchApp:
             if name_of_house != "指定しない":
                 search_params["nameOfHouse"] = name_of_house
             if from_date:
-                search_params["from"] = from_date.strftime('%Y-%m-%d')
+                search_params["from"] = from_date.isoformat()
             if until_date:
-                search_params["until"] = until_date.strftime('%Y-%m-%d')
+                search_params["until"] = until_date.isoformat()
+        
+        # 検索結果を表示するか（前回の結果・今回の検索結果のどちらか）
+        show_results = False
         
         # 既存の検索結果がある場合は表示
-        if st.session_state.search_results and not (search_button or (auto_search and current_params)):
+        if st.session_state.search_results and not search_button:
             col1, col2 = st.columns([3, 1])
             with col1:
                 st.success(f"📊 前回の検索結果が表示されています。")
@@ -700,69 +1778,11 @@ class KokkaiSearchApp:
                     st.session_state.analytics_data = {}
                     if 'meeting_analysis' in st.session_state:
                         del st.session_state.meeting_analysis
+                    st.session_state.meeting_view_cache = {}
                     st.rerun()
-            
-            data = st.session_state.search_results
-            current_keyword = st.session_state.get('current_search_params', {}).get('any', '')
-            
-            # エクスポート機能
-            export_df = self.export_results(data, st.session_state.get('current_search_params', {}))
-            if export_df is not None:
-                csv = export_df.to_csv(index=False, encoding='utf-8-sig')
-                st.download_button(
-                    label="📄 検索結果をCSVでダウンロード",
-                    data=csv,
-                    file_name=f"kokkai_search_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
-            
-            # 検索結果表示
-            for i, record in enumerate(data["speechRecord"]):
-                with st.expander(f"📝 {record['speaker']}（{record['nameOfMeeting']}）- {record['date']}"):
-                    col1, col2 = st.columns([3, 1])
-                    
-                    with col1:
-                        st.markdown(f"**📅 発言日:** {record['date']}")
-                        st.markdown(f"**👤 発言者:** {record['speaker']}")
-                        st.markdown(f"**🏛️ 会議:** {record['nameOfMeeting']}")
-                        st.markdown(f"**🏢 院:** {record.get('nameOfHouse', '不明')}")
-                    
-                    with col2:
-                        speech_length = len(record['speech'])
-                        st.metric("文字数", f"{speech_length:,}")
-                    
-                    st.markdown("---")
-                    
-                    # 発言内容のハイライト表示
-                    speech_text = record['speech']
-                    highlighted_speech = self.highlight_text(speech_text, current_keyword)
-                    
-                    st.markdown(
-                        f'<div class="speech-card" style="height: 300px; overflow-y: auto;">{highlighted_speech}</div>',
-                        unsafe_allow_html=True
-                    )
-                    
-                    st.markdown(f"🔗 [発言の全文と周辺議事を読む]({record['speechURL']})")
+            show_results = True
         
-        if search_button or (auto_search and current_params):
-            # 自動検索の場合は既にsearch_paramsが設定されている
-            if not auto_search:
-                # 通常の検索ボタンが押された場合のパラメータ構築
-                search_params = {}
-                
-                if keyword:
-                    search_params["any"] = keyword
-                if speaker:
-                    search_params["speaker"] = speaker
-                if name_of_meeting:
-                    search_params["nameOfMeeting"] = name_of_meeting
-                if name_of_house != "指定しない":
-                    search_params["nameOfHouse"] = name_of_house
-                if from_date:
-                    search_params["from"] = from_date.strftime('%Y-%m-%d')
-                if until_date:
-                    search_params["until"] = until_date.strftime('%Y-%m-%d')
-
+        if search_button:
             # 検索パラメータが空でないかチェック
             if search_params:
                 # デバッグ情報を表示
@@ -772,65 +1792,38 @@ class KokkaiSearchApp:
                 st.session_state['current_search_params'] = search_params
                 
                 with st.spinner("🔍 検索中です..."):
-                    time.sleep(1)
-                    data = self.search_speeches(search_params)
+                    data = self.search_speeches(search_params, fetch_limit)
                     
                     if data and "speechRecord" in data and data["speechRecord"]:
                         st.session_state.search_results = data
+                        
+                        # 形態素解析（プロセスプールが有効な場合は別プロセス）を先に投入し、その間に検索結果の集計を行う
+                        pending = self._submit_keyword_prefetch(data["speechRecord"]) if self.tokenizer else None
                         st.session_state.analytics_data = self.analyze_search_results(data)
                         
                         # janome利用可能な場合のみキーワード分析を実行
                         if self.tokenizer:
+                            self._collect_keyword_prefetch(pending)
                             st.session_state.meeting_analysis = self.analyze_meeting_keywords(data)
+                            st.session_state.meeting_view_cache = {}
                         
                         # 検索履歴に追加
                         self.add_to_search_history(search_params, data['numberOfRecords'])
                         
                         # 成功メッセージ
-                        st.success(f"✅ 検索結果が {data['numberOfRecords']} 件見つかりました。（最大30件表示）")
-                        
-                        # エクスポート機能
-                        export_df = self.export_results(data, search_params)
-                        if export_df is not None:
-                            csv = export_df.to_csv(index=False, encoding='utf-8-sig')
-                            st.download_button(
-                                label="📄 検索結果をCSVでダウンロード",
-                                data=csv,
-                                file_name=f"kokkai_search_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                                mime="text/csv"
-                            )
-                        
-                        # 検索結果表示
-                        for i, record in enumerate(data["speechRecord"]):
-                            with st.expander(f"📝 {record['speaker']}（{record['nameOfMeeting']}）- {record['date']}"):
-                                col1, col2 = st.columns([3, 1])
-                                
-                                with col1:
-                                    st.markdown(f"**📅 発言日:** {record['date']}")
-                                    st.markdown(f"**👤 発言者:** {record['speaker']}")
-                                    st.markdown(f"**🏛️ 会議:** {record['nameOfMeeting']}")
-                                    st.markdown(f"**🏢 院:** {record.get('nameOfHouse', '不明')}")
-                                
-                                with col2:
-                                    speech_length = len(record['speech'])
-                                    st.metric("文字数", f"{speech_length:,}")
-                                
-                                st.markdown("---")
-                                
-                                # 発言内容のハイライト表示
-                                speech_text = record['speech']
-                                highlighted_speech = self.highlight_text(speech_text, keyword)
-                                
-                                st.markdown(
-                                    f'<div class="speech-card" style="height: 300px; overflow-y: auto;">{highlighted_speech}</div>',
-                                    unsafe_allow_html=True
-                                )
-                                
-                                st.markdown(f"🔗 [発言の全文と周辺議事を読む]({record['speechURL']})")
+                        st.success(f"✅ 検索結果が {data['numberOfRecords']} 件見つかりました。（最大{fetch_limit}件表示）")
+                        show_results = True
                     else:
                         st.warning("⚠️ 検索結果が見つかりませんでした。条件を変えて試してください。")
             else:
                 st.error("❌ 検索条件を何か一つ以上入力してください。")
+        
+        # 検索結果の表示（前回の結果・今回の検索結果で共通）
+        if show_results:
+            self.render_search_results(
+                st.session_state.search_results,
+                st.session_state.get('current_search_params', {})
+            )
 
     def meeting_analysis_page(self):
         st.markdown('<h2 class="sub-header">🏛️ 会議別キーワード分析</h2>', unsafe_allow_html=True)
@@ -856,36 +1849,21 @@ class KokkaiSearchApp:
         )
         
         if selected_meeting:
-            if selected_meeting == "すべての会議":
-                # すべての会議のデータを統合
-                all_keywords = {}
-                all_speakers = set()
-                total_speeches = 0
-                total_characters = 0
-                
-                for meeting_name, meeting_data in meeting_analysis.items():
-                    # キーワードを統合
-                    for keyword, count in meeting_data['keywords'].items():
-                        if keyword in all_keywords:
-                            all_keywords[keyword] += count
-                        else:
-                            all_keywords[keyword] = count
-                    
-                    # 発言者を統合
-                    all_speakers.update(meeting_data['speakers'])
-                    total_speeches += meeting_data['total_speeches']
-                    total_characters += meeting_data['total_characters']
-                
-                # 統合されたデータを作成
-                meeting_data = {
-                    'keywords': dict(sorted(all_keywords.items(), key=lambda x: x[1], reverse=True)),
-                    'speakers': list(all_speakers),
-                    'total_speeches': total_speeches,
-                    'total_characters': total_characters,
-                    'speeches': []  # 全発言データは重複する可能性があるため空にする
-                }
-            else:
-                meeting_data = meeting_analysis[selected_meeting]
+            # 表示用データは会議ごとにセッション内で一度だけ計算する
+            # （検索のたびにmeeting_view_cacheは空にリセットされる）
+            view_cache = st.session_state.setdefault('meeting_view_cache', {})
+            view = view_cache.get(selected_meeting)
+            if view is None:
+                if selected_meeting == "すべての会議":
+                    # すべての会議のデータを統合（同じ検索結果では再計算しない）
+                    meeting_data = _aggregate_all_meetings(
+                        _records_key(st.session_state.search_results["speechRecord"]),
+                        meeting_analysis
+                    )
+                else:
+                    meeting_data = meeting_analysis[selected_meeting]
+                view = view_cache[selected_meeting] = _build_meeting_view(meeting_data)
+            meeting_data = view['meeting']
             
             # 会議の基本情報
             if selected_meeting == "すべての会議":
@@ -902,8 +1880,7 @@ class KokkaiSearchApp:
             with col3:
                 st.metric("総文字数", f"{meeting_data['total_characters']:,}字")
             with col4:
-                avg_chars = meeting_data['total_characters'] // meeting_data['total_speeches']
-                st.metric("平均文字数", f"{avg_chars:,}字/発言")
+                st.metric("平均文字数", f"{meeting_data['avg_characters']:,}字/発言")
             
             # 発言者一覧
             if selected_meeting == "すべての会議":
@@ -911,8 +1888,7 @@ class KokkaiSearchApp:
             else:
                 st.markdown("### 👥 発言者一覧")
             
-            speakers_text = "、".join(meeting_data['speakers'])
-            st.write(speakers_text)
+            st.write(meeting_data['speakers_text'])
             
             st.markdown("---")
             
@@ -928,46 +1904,27 @@ class KokkaiSearchApp:
                     col1, col2 = st.columns([2, 1])
                     
                     with col1:
-                        keywords_df = pd.DataFrame(
-                            list(meeting_data['keywords'].items())[:20], 
-                            columns=['キーワード', '出現回数']
-                        )
-                        
                         # タイトルを動的に設定
                         if selected_meeting == "すべての会議":
                             title = "すべての会議 - 主要キーワード Top20"
                         else:
                             title = f"{selected_meeting} - 主要キーワード Top20"
                         
-                        fig = px.bar(
-                            keywords_df, 
-                            x='出現回数', 
-                            y='キーワード', 
-                            orientation='h',
-                            title=title,
-                            color='出現回数',
-                            color_continuous_scale='Viridis'
-                        )
-                        fig.update_layout(height=600)
+                        fig = _build_keyword_bar_fig(view['top20'], title)
                         st.plotly_chart(fig, use_container_width=True)
                     
                     with col2:
                         st.markdown("#### 📋 キーワード一覧")
-                        for i, (keyword, count) in enumerate(list(meeting_data['keywords'].items())[:15], 1):
-                            st.write(f"{i:2d}. **{keyword}** ({count}回)")
+                        st.markdown(view['top15_markdown'])
                 
                 with tab2:
                     # ワードクラウド
                     st.markdown("#### ☁️ ワードクラウド")
                     if self.tokenizer:
-                        wordcloud = self.create_wordcloud(meeting_data['keywords'])
+                        wordcloud_png = self.create_wordcloud(meeting_data['keywords'])
                         
-                        if wordcloud:
-                            fig, ax = plt.subplots(figsize=(12, 6))
-                            ax.imshow(wordcloud, interpolation='bilinear')
-                            ax.axis('off')
-                            st.pyplot(fig)
-                            plt.close()
+                        if wordcloud_png:
+                            st.image(wordcloud_png, use_container_width=True)
                         else:
                             st.warning("ワードクラウドを生成できませんでした。")
                     else:
@@ -978,39 +1935,20 @@ class KokkaiSearchApp:
                     # 詳細分析
                     st.markdown("#### 📈 キーワード詳細分析")
                     
-                    # キーワード長別分布
-                    keyword_lengths = [len(k) for k in meeting_data['keywords'].keys()]
-                    length_counts = Counter(keyword_lengths)
-                    
                     col1, col2 = st.columns(2)
                     
                     with col1:
-                        length_df = pd.DataFrame(
-                            list(length_counts.items()), 
-                            columns=['文字数', '単語数']
-                        ).sort_values('文字数')
-                        
-                        fig = px.bar(
-                            length_df, 
-                            x='文字数', 
-                            y='単語数',
-                            title="キーワード文字数分布"
+                        fig = _build_distribution_fig(
+                            view['length_distribution'],
+                            '文字数', "キーワード文字数分布"
                         )
                         st.plotly_chart(fig, use_container_width=True)
                     
                     with col2:
                         # 出現頻度分布
-                        freq_counts = Counter(meeting_data['keywords'].values())
-                        freq_df = pd.DataFrame(
-                            list(freq_counts.items()), 
-                            columns=['出現回数', '単語数']
-                        ).sort_values('出現回数')
-                        
-                        fig = px.bar(
-                            freq_df, 
-                            x='出現回数', 
-                            y='単語数',
-                            title="出現頻度分布"
+                        fig = _build_distribution_fig(
+                            view['frequency_distribution'],
+                            '出現回数', "出現頻度分布"
                         )
                         st.plotly_chart(fig, use_container_width=True)
                     
@@ -1019,33 +1957,37 @@ class KokkaiSearchApp:
                     col1, col2, col3 = st.columns(3)
                     
                     with col1:
-                        total_keywords = len(meeting_data['keywords'])
-                        st.metric("ユニーク単語数", f"{total_keywords}")
+                        st.metric("ユニーク単語数", f"{view['total_keywords']}")
                     
                     with col2:
-                        total_occurrences = sum(meeting_data['keywords'].values())
-                        st.metric("総出現回数", f"{total_occurrences}")
+                        st.metric("総出現回数", f"{view['total_occurrences']}")
                     
                     with col3:
-                        avg_occurrence = total_occurrences / total_keywords if total_keywords > 0 else 0
-                        st.metric("平均出現回数", f"{avg_occurrence:.1f}")
+                        st.metric("平均出現回数", f"{view['avg_occurrence']:.1f}")
                 
                 # キーワード検索機能
                 st.markdown("---")
                 st.markdown("### 🔍 キーワード検索")
-                search_keyword = st.text_input("特定のキーワードを検索", placeholder="例：デジタル")
+                # フォーム内に置き、入力の確定（検索ボタン）時だけ再実行する
+                with st.form("meeting_keyword_search_form"):
+                    search_keyword = st.text_input("特定のキーワードを検索", placeholder="例：デジタル")
+                    st.form_submit_button("🔍 検索")
                 
                 if search_keyword:
+                    # 小文字化済みのキーワードと照合（keywordsは出現回数の降順のため並べ替え不要）
+                    needle = search_keyword.lower()
                     matching_keywords = {
-                        k: v for k, v in meeting_data['keywords'].items() 
-                        if search_keyword.lower() in k.lower()
+                        k: v for (k, v), k_lower in zip(meeting_data['keywords'].items(), meeting_data['keywords_lower'])
+                        if needle in k_lower
                     }
                     
                     if matching_keywords:
                         st.success(f"'{search_keyword}' に関連するキーワードが {len(matching_keywords)} 個見つかりました。")
                         
-                        for keyword, count in sorted(matching_keywords.items(), key=lambda x: x[1], reverse=True):
-                            st.write(f"• **{keyword}**: {count}回")
+                        # 1件ずつst.writeせず、改行でつないで1回で表示する
+                        st.markdown("  \n".join(
+                            f"• **{keyword}**: {count}回" for keyword, count in matching_keywords.items()
+                        ))
                     else:
                         st.warning(f"'{search_keyword}' に関連するキーワードは見つかりませんでした。")
             
@@ -1058,35 +2000,16 @@ class KokkaiSearchApp:
         if st.session_state.analytics_data:
             analytics = st.session_state.analytics_data
             
-            # サマリー表示
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.markdown(
-                    f'<div class="metric-card"><h3>📊 総件数</h3><h2>{analytics["total_records"]}</h2></div>',
-                    unsafe_allow_html=True
-                )
-            
-            with col2:
-                avg_length = int(analytics.get("avg_speech_length", 0))
-                st.markdown(
-                    f'<div class="metric-card"><h3>📝 平均文字数</h3><h2>{avg_length:,}</h2></div>',
-                    unsafe_allow_html=True
-                )
-            
-            with col3:
-                unique_speakers = len(analytics.get("speaker_counts", {}))
-                st.markdown(
-                    f'<div class="metric-card"><h3>👥 発言者数</h3><h2>{unique_speakers}</h2></div>',
-                    unsafe_allow_html=True
-                )
-            
-            with col4:
-                unique_meetings = len(analytics.get("meeting_counts", {}))
-                st.markdown(
-                    f'<div class="metric-card"><h3>🏛️ 会議数</h3><h2>{unique_meetings}</h2></div>',
-                    unsafe_allow_html=True
-                )
+            # サマリー表示（4枚のカードを1回のst.markdownで描画）
+            st.markdown(
+                _build_metric_cards_html(
+                    analytics["total_records"],
+                    int(analytics.get("avg_speech_length", 0)),
+                    len(analytics.get("speaker_counts", {})),
+                    len(analytics.get("meeting_counts", {}))
+                ),
+                unsafe_allow_html=True
+            )
             
             st.markdown("---")
             
@@ -1107,9 +2030,18 @@ class KokkaiSearchApp:
                 st.rerun()
         
         if st.session_state.search_history:
-            st.write(f"📊 検索履歴: {len(st.session_state.search_history)}件")
+            history = st.session_state.search_history
+            st.write(f"📊 検索履歴: {len(history)}件")
+            
+            # 表示中のページの履歴だけウィジェットを生成する
+            page_count = max(1, -(-len(history) // HISTORY_PAGE_SIZE))
+            page_num = 1
+            if page_count > 1:
+                page_num = st.number_input("ページ", min_value=1, max_value=page_count, value=1, step=1,
+                                           help=f"{HISTORY_PAGE_SIZE}件ずつ表示します（全{page_count}ページ）")
+            start = (page_num - 1) * HISTORY_PAGE_SIZE
             
-            for i, item in enumerate(st.session_state.search_history):
+            for i, item in enumerate(history[start:start + HISTORY_PAGE_SIZE], start):
                 with st.expander(f"🕐 {item['timestamp']} - {item['results_count']}件"):
                     # 検索条件を読みやすい形式で表示
                     params = item.get('params', {})
@@ -1164,6 +2096,7 @@ class KokkaiSearchApp:
         - **会議名検索**: 委員会名などで検索
         - **期間指定**: 日付範囲での絞り込み
         - **院別検索**: 衆議院・参議院での絞り込み
+        - **取得件数**: 1回の検索で取得する件数を指定（最大200件）
         
         ### 🏛️ 会議別キーワード分析機能
         - **形態素解析**: janomeライブラリによる日本語テキスト解析
@@ -35,50 +35,22 @@
 # =============================================================================
 
 import streamlit as st
-import requests
-import time
-import re
-from datetime import date, datetime
-import json
-import pandas as pd
-from collections import Counter
-import plotly.express as px
-import plotly.graph_objects as go
-import os
 
-# =============================================================================
-# 条件付きインポート設定
-# =============================================================================
-# 
-# 説明:
-# 一部のライブラリはオプション機能として実装されており、
-# インストールされていない場合でもアプリケーションは動作します。
-# 各ライブラリの利用可能性をチェックし、適切な警告を表示します。
-
-# Janome（日本語形態素解析）の条件付きインポート
-try:
-    from janome.tokenizer import Tokenizer
-    st.success("✅ Janomeライブラリが正常に読み込まれました。形態素解析機能が利用可能です。")
-except ImportError:
-    st.warning("⚠️ Janomeライブラリがインストールされていません。形態素解析機能は無効です。")
-    st.info("💡 形態素解析機能を有効にするには: pip install janome")
-
-# WordCloud（ワードクラウド生成）の条件付きインポート
-try:
-    from wordcloud import WordCloud
-    import matplotlib.pyplot as plt
-    import matplotlib.font_manager as fm
-    import numpy as np
-    st.success("✅ WordCloudライブラリが正常に読み込まれました。ワードクラウド機能が利用可能です。")
-except ImportError:
-    st.warning("⚠️ WordCloudライブラリがインストールされていません。ワードクラウド機能は無効です。")
-    st.info("💡 ワードクラウド機能を有効にするには: pip install wordcloud matplotlib")
+# plotly・janome・wordcloud・matplotlibはlogic.py側で使用する関数内でのみ
+# インポートする（ヘルプ・履歴ページのみの表示では読み込まない）
 
 # =============================================================================
 # ローカルモジュールのインポート
 # =============================================================================
-from components import show_sidebar
-from logic import KokkaiSearchApp
+# 
+# 説明:
+# Janome・WordCloudなどのオプション機能の利用可能性は、logic.pyで
+# プロセス起動時に一度だけ判定します（JANOME_AVAILABLE / WORDCLOUD_AVAILABLE）。
+# 再実行のたびにインポートやメッセージ表示を行わず、利用可否は
+# サイドバーの「アプリケーション情報」に表示します。
+# 検索履歴の読み込みは、書き込み・重複判定と同じlogic.pyで行います。
+from components import show_sidebar, inject_custom_css
+from logic import KokkaiSearchApp, JANOME_AVAILABLE, load_search_history
 
 # =============================================================================
 # アプリケーション設定
@@ -98,125 +70,28 @@ st.set_page_config(
 )
 
 # =============================================================================
-# カスタムCSSスタイル定義
+# カスタムCSSスタイル
 # =============================================================================
 # 
 # 説明:
-# アプリケーションの見た目を改善するためのカスタムCSSを定義します。
-# 各クラスは特定のUI要素のスタイリングに使用されます。
+# CSS文字列はcomponents.pyのモジュール定数として一度だけ読み込まれます。
+# 再実行（rerun）のたびに表示要素は作り直されるため、注入自体は毎回行います。
 
-st.markdown("""
-<style>
-    /* メインヘッダーのスタイル */
-    .main-header {
-        font-size: 3rem;
-        color: #1f4e79;
-        text-align: center;
-        margin-bottom: 2rem;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-        font-weight: bold;
-    }
-    
-    /* サブヘッダーのスタイル */
-    .sub-header {
-        font-size: 1.5rem;
-        color: #2e6da4;
-        margin-bottom: 1rem;
-        font-weight: 600;
-    }
-    
-    /* ハイライトボックスのスタイル */
-    .highlight-box {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 20px;
-        border-radius: 10px;
-        color: white;
-        margin: 20px 0;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-    }
-    
-    /* メトリックカードのスタイル */
-    .metric-card {
-        background: white;
-        padding: 20px;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        border-left: 4px solid #1f4e79;
-        margin: 10px 0;
-    }
-    
-    /* 発言カードのスタイル */
-    .speech-card {
-        background: #f8f9fa;
-        border: 1px solid #dee2e6;
-        border-radius: 8px;
-        padding: 15px;
-        margin: 10px 0;
-        border-left: 4px solid #17a2b8;
-        transition: all 0.3s ease;
-    }
-    
-    .speech-card:hover {
-        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        transform: translateY(-2px);
-    }
-</style>
-""", unsafe_allow_html=True)
+inject_custom_css()
 
 # =============================================================================
-# ユーティリティ関数
+# ページルーティング
 # =============================================================================
 
-def load_search_history():
-    """
-    検索履歴をCSVファイルから読み込む関数
-    
-    機能:
-    - search_history.csvファイルから検索履歴を読み込み
-    - JSON形式で保存されたパラメータを辞書形式に変換
-    - エラーハンドリングによる安全な読み込み
-    
-    戻り値:
-    - list: 検索履歴のリスト（辞書形式）
-    
-    エラー処理:
-    - ファイルが存在しない場合: 空のリストを返す
-    - 読み込みエラーの場合: 警告を表示して空のリストを返す
-    """
-    csv_file = 'search_history.csv'
-    if os.path.exists(csv_file):
-        try:
-            # CSVファイルをUTF-8エンコーディングで読み込み
-            df = pd.read_csv(csv_file, encoding='utf-8-sig')
-            
-            # CSVから辞書のリストに変換
-            history_list = []
-            for _, row in df.iterrows():
-                # paramsカラムをJSONから辞書に変換
-                params_str = row.get('params', '{}')
-                try:
-                    params = json.loads(params_str) if isinstance(params_str, str) else params_str
-                except json.JSONDecodeError:
-                    # JSON解析エラーの場合は空の辞書を使用
-                    params = {}
-                
-                # 履歴アイテムを作成
-                history_item = {
-                    'timestamp': row.get('timestamp', ''),
-                    'params': params,
-                    'results_count': row.get('results_count', 0)
-                }
-                history_list.append(history_item)
-            
-            st.success(f"✅ 検索履歴を正常に読み込みました（{len(history_list)}件）")
-            return history_list
-            
-        except Exception as e:
-            st.warning(f"⚠️ 検索履歴の読み込みに失敗しました: {e}")
-            return []
-    else:
-        st.info("ℹ️ 検索履歴ファイルが見つかりません。新しい履歴から開始します。")
-        return []
+# ページ名 → (表示メッセージ, ページ描画メソッド)
+# 再実行ごとのif/elif比較の連鎖を辞書の参照1回に置き換える
+_PAGE_ROUTES = {
+    "🔍 検索": ("🔍 検索ページを表示しています...", KokkaiSearchApp.search_page),
+    "📊 分析": ("📊 分析ページを表示しています...", KokkaiSearchApp.analysis_page),
+    "🏛️ 会議別キーワード分析": ("🏛️ 会議別キーワード分析ページを表示しています...", KokkaiSearchApp.meeting_analysis_page),
+    "📚 検索履歴": ("📚 検索履歴ページを表示しています...", KokkaiSearchApp.history_page),
+}
+_HELP_ROUTE = ("ℹ️ ヘルプページを表示しています...", KokkaiSearchApp.help_page)
 
 # =============================================================================
 # メイン関数
@@ -273,35 +148,18 @@ def main():
     # セッション状態からページを取得（再検索時の自動移動用）
     current_page = st.session_state.get('current_page', page)
     
-    # ページに応じた処理の分岐
-    if current_page == "🔍 検索":
-        st.info("🔍 検索ページを表示しています...")
-        app.search_page()
-        
-    elif current_page == "📊 分析":
-        st.info("📊 分析ページを表示しています...")
-        app.analysis_page()
-        
-    elif current_page == "🏛️ 会議別キーワード分析":
-        # Janomeライブラリの利用可能性をチェック
-        try:
-            from janome.tokenizer import Tokenizer
-            st.info("🏛️ 会議別キーワード分析ページを表示しています...")
-            app.meeting_analysis_page()
-        except ImportError:
-            st.error("❌ キーワード分析機能は利用できません。Janomeライブラリがインストールされていません。")
-            st.info("💡 キーワード分析機能を有効にするには: pip install janome")
-            # 検索ページにリダイレクト
-            st.session_state['current_page'] = "🔍 検索"
-            st.rerun()
-        
-    elif current_page == "📚 検索履歴":
-        st.info("📚 検索履歴ページを表示しています...")
-        app.history_page()
-        
-    else:
-        st.info("ℹ️ ヘルプページを表示しています...")
-        app.help_page()
+    # Janome未インストール時に会議別キーワード分析が選ばれた場合は検索ページに戻す
+    if current_page == "🏛️ 会議別キーワード分析" and not JANOME_AVAILABLE:
+        st.error("❌ キーワード分析機能は利用できません。Janomeライブラリがインストールされていません。")
+        st.info("💡 キーワード分析機能を有効にするには: pip install janome")
+        # 検索ページにリダイレクト
+        st.session_state['current_page'] = "🔍 検索"
+        st.rerun()
+    
+    # ページ名から表示処理を引く（未知のページはヘルプページ）
+    message, render_page = _PAGE_ROUTES.get(current_page, _HELP_ROUTE)
+    st.info(message)
+    render_page(app)
 
 # =============================================================================
 # アプリケーションエントリーポイント